@@ -18,6 +18,9 @@ if sys.platform == 'win32':
         pass
 from typing import Any, Dict, List
 
+# Suffix for truncated type definitions, interned once at module level
+_ELLIPSIS = "..."
+
 
 def extract_typescript_interfaces(content: str) -> List[str]:
     """
@@ -82,11 +85,13 @@ def extract_typescript_interfaces(content: str) -> List[str]:
     for match in type_pattern.finditer(content):
         name = match.group(1)
         value = match.group(2).strip()
+        # Only normalize whitespace when the value actually spans lines
+        if "\n" in value or "\t" in value:
+            value = re.sub(r"\s+", " ", value)
         # Truncate long type definitions
         if len(value) > 60:
-            value = value[:57] + "..."
-        sig = f"type {name} = {value}"
-        interfaces.append(sig)
+            value = value[:57] + _ELLIPSIS
+        interfaces.append(f"type {name} = {value}")
 
     return interfaces
 
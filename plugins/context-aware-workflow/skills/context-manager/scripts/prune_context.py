@@ -10,6 +10,14 @@ import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import numpy as np
+except ImportError:  # Optional: only used to batch staleness on large manifests
+    np = None
+
+# Manifest size below which vectorization is not worth the array setup
+_NUMPY_MIN_FILES = 1024
+
 
 def is_referenced_in_plan(file_path: str, plan_content: Optional[str]) -> bool:
     """
@@ -67,6 +75,32 @@ def calculate_staleness(file_info: Dict[str, Any], now: datetime) -> int:
         return 0
 
 
+def _batch_staleness(files: List[Dict[str, Any]], now: datetime) -> List[int]:
+    """
+    Compute staleness hours for a batch of file entries.
+
+    For large manifests (thousands of files) the per-file fromisoformat
+    and timedelta math dominates, so when NumPy is available the
+    timestamps are parsed into a datetime64 array and subtracted in one
+    vectorized pass. Smaller manifests, or any batch with timestamps
+    NumPy cannot parse, use the per-file calculate_staleness path.
+    """
+    if np is None or len(files) < _NUMPY_MIN_FILES:
+        return [calculate_staleness(fi, now) for fi in files]
+
+    raw = [fi.get("last_accessed") or fi.get("added") or "" for fi in files]
+    try:
+        arr = np.array(
+            [s[:19] if s else "1970-01-01T00:00:00" for s in raw],
+            dtype="datetime64[s]"
+        )
+        hours = (np.datetime64(now.replace(microsecond=0)) - arr).astype("int64") // 3600
+    except ValueError:
+        return [calculate_staleness(fi, now) for fi in files]
+
+    return [int(h) if s else 0 for h, s in zip(hours, raw)]
+
+
 def analyze_files(
     manifest: Dict[str, Any],
     plan_content: str,
@@ -108,9 +142,15 @@ def analyze_files(
     now = datetime.now()
     half_threshold = threshold_hours / 2
 
-    for file_info in files:
+    # Skip plan checks entirely when no plan exists (common early in a
+    # workflow). With a plan, pre-split it into tokens once so the common
+    # token-aligned reference is an O(1) set lookup; fall back to the
+    # substring scan only when the fast path misses.
+    check_plan = bool(plan_content)
+    plan_tokens = set(plan_content.split()) if check_plan else frozenset()
+
+    for file_info, staleness in zip(files, _batch_staleness(files, now)):
         path = file_info.get("path", "")
-        staleness = calculate_staleness(file_info, now)
 
         entry = {
             "path": path,
@@ -119,7 +159,11 @@ def analyze_files(
         }
 
         # Check if referenced in plan - always keep
-        if is_referenced_in_plan(path, plan_content):
+        if check_plan and (
+            path in plan_tokens
+            or os.path.basename(path) in plan_tokens
+            or is_referenced_in_plan(path, plan_content)
+        ):
             entry["recommendation"] = "Keep - referenced in task plan"
             result["keep"].append(entry)
             continue
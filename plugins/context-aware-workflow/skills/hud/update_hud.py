@@ -9,20 +9,27 @@ Environment:
     CAW_HUD=enabled|disabled|minimal
 """
 
+import functools
 import json
 import os
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-# Windows UTF-8 support
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-        sys.stderr.reconfigure(encoding='utf-8')
-    except AttributeError:
-        pass
+def _ensure_utf8_stdio() -> None:
+    """Reconfigure stdio for UTF-8 on Windows.
+
+    Deferred to just before output is written, so the common
+    disabled-HUD invocation skips the reconfigure entirely.
+    """
+    if sys.platform == 'win32':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+            sys.stderr.reconfigure(encoding='utf-8')
+        except AttributeError:
+            pass
 
 
 # Model pricing (per 1M tokens)
@@ -32,40 +39,80 @@ PRICING = {
     "opus": {"input": 15.00, "output": 75.00}
 }
 
+# Per-token cost factors derived from PRICING, so the hot path is two
+# multiplies and an add with no division
+_COST_FACTORS = {
+    tier: (rates["input"] / 1_000_000, rates["output"] / 1_000_000)
+    for tier, rates in PRICING.items()
+}
+
 
+@functools.lru_cache(maxsize=1)
 def find_caw_root() -> Optional[Path]:
-    """Find .caw directory starting from current working directory."""
-    cwd = Path.cwd()
-    for path in [cwd, *cwd.parents]:
-        caw_dir = path / ".caw"
-        if caw_dir.is_dir():
-            return caw_dir
-    return None
+    """Find .caw directory starting from current working directory.
+
+    Walks ancestors with plain string paths (one isdir stat per level)
+    rather than materializing a Path object for every parent.
+    """
+    current = os.getcwd()
+    while True:
+        caw_dir = os.path.join(current, ".caw")
+        if os.path.isdir(caw_dir):
+            return Path(caw_dir)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+# Parsed-JSON cache keyed by path: {path: (st_mtime_ns, parsed_dict)}.
+# Mostly pays off when the hook runs in a long-lived process; per-invocation
+# runs just take one extra stat per file.
+_JSON_CACHE: dict = {}
 
 
 def load_json_safe(path: Path) -> dict:
-    """Load JSON file safely, returning empty dict on failure."""
+    """Load JSON file safely, returning empty dict on failure.
+
+    Caches parsed contents per-process and re-reads only when the file's
+    mtime changes, so unchanged state files cost a single stat call.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+        return {}
+
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     try:
-        if path.exists():
-            return json.loads(path.read_text(encoding='utf-8'))
+        data = json.loads(path.read_text(encoding='utf-8'))
     except (json.JSONDecodeError, OSError):
-        pass
-    return {}
+        return {}
+
+    _JSON_CACHE[path] = (mtime_ns, data)
+    return data
 
 
 def calculate_cost(tokens_in: int, tokens_out: int, model: str) -> float:
     """Calculate cost based on token usage and model."""
-    pricing = PRICING.get(model.lower(), PRICING["sonnet"])
-    cost = (tokens_in * pricing["input"] + tokens_out * pricing["output"]) / 1_000_000
-    return round(cost, 4)
+    factors = _COST_FACTORS.get(model) or _COST_FACTORS.get(model.lower(), _COST_FACTORS["sonnet"])
+    return round(tokens_in * factors[0] + tokens_out * factors[1], 4)
+
+
+# All 13 possible bars for the default width, precomputed once at import
+_BARS12 = tuple("\u2588" * i + "\u2591" * (12 - i) for i in range(13))
 
 
 def render_progress_bar(percentage: float, width: int = 12) -> str:
     """Render a text-based progress bar."""
     percentage = max(0, min(100, percentage))
     filled = int(width * percentage / 100)
-    empty = width - filled
-    return "\u2588" * filled + "\u2591" * empty
+    if width == 12:
+        return _BARS12[filled]
+    return "\u2588" * filled + "\u2591" * (width - filled)
 
 
 def format_tokens(count: int) -> str:
@@ -84,12 +131,38 @@ def format_time(seconds: int) -> str:
     return f"{secs}s"
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_started(started_at: str) -> datetime:
+    """Parse a workflow start timestamp, cached per raw string.
+
+    The start time is immutable for a workflow's lifetime, so repeated
+    hooks reuse the parsed datetime instead of re-running fromisoformat.
+    """
+    return datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+
+
+# Common spellings included verbatim so the fast path skips .lower()
+_FULL_MODES = frozenset({
+    "enabled", "true", "1", "full",
+    "ENABLED", "TRUE", "FULL", "Enabled", "True", "Full"
+})
+_MINIMAL_MODES = frozenset({"minimal", "MINIMAL", "Minimal"})
+
+
 def get_hud_mode() -> str:
     """Get HUD display mode from environment."""
-    mode = os.environ.get("CAW_HUD", "disabled").lower()
-    if mode in ("enabled", "true", "1", "full"):
+    mode = os.environ.get("CAW_HUD")
+    if not mode:
+        return "disabled"
+    if mode in _FULL_MODES:
+        return "full"
+    if mode in _MINIMAL_MODES:
+        return "minimal"
+    # Unusual casing: normalize once and re-check
+    mode = mode.lower()
+    if mode in _FULL_MODES:
         return "full"
-    elif mode == "minimal":
+    if mode == "minimal":
         return "minimal"
     return "disabled"
 
@@ -141,7 +214,7 @@ def update_hud(caw_root: Path) -> dict:
     elapsed_seconds = 0
     if started_at:
         try:
-            start_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+            start_time = _parse_started(started_at)
             elapsed_seconds = int((datetime.now(start_time.tzinfo) - start_time).total_seconds())
         except (ValueError, TypeError):
             pass
@@ -170,55 +243,64 @@ def update_hud(caw_root: Path) -> dict:
         "metrics": hud_metrics
     })
 
-    # Save HUD state
+    # Save HUD state atomically: write a temp file in the same directory
+    # and rename over hud.json so concurrent readers never see a torn write
     try:
-        (caw_root / "hud.json").write_text(
-            json.dumps(hud_state, indent=2),
-            encoding='utf-8'
-        )
+        payload = json.dumps(hud_state, indent=2).encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=str(caw_root), prefix=".hud.", suffix=".json")
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        try:
+            os.replace(tmp_path, caw_root / "hud.json")
+        except OSError:
+            os.unlink(tmp_path)
+            raise
     except OSError:
         pass
 
     return hud_metrics
 
 
+# Render-time constants: fixed horizontal rule and the three tier names
+_HUD_RULE = "\u2501" * 48
+_MODEL_CAP = {"haiku": "Haiku", "sonnet": "Sonnet", "opus": "Opus"}
+
+
 def render_full_hud(metrics: dict) -> str:
     """Render full HUD display."""
-    phase = metrics.get("phase", 0)
-    total_phases = metrics.get("total_phases", 0)
-    step = metrics.get("step", 0)
-    total_steps = metrics.get("total_steps", 0)
-    progress = metrics.get("progress_pct", 0)
-    tokens_in = metrics.get("tokens_in", 0)
-    tokens_out = metrics.get("tokens_out", 0)
-    cost = metrics.get("estimated_cost", 0)
-    model = metrics.get("model_tier", "sonnet").capitalize()
-    mode = metrics.get("active_mode", "NORMAL")
-    elapsed = metrics.get("elapsed_seconds", 0)
+    g = metrics.get
+    phase = g("phase", 0)
+    total_phases = g("total_phases", 0)
+    step = g("step", 0)
+    total_steps = g("total_steps", 0)
+    progress = g("progress_pct", 0)
+    cost = g("estimated_cost", 0)
+    tier = g("model_tier", "sonnet")
+    model = _MODEL_CAP.get(tier) or tier.capitalize()
+    mode = g("active_mode", "NORMAL")
 
     progress_bar = render_progress_bar(progress)
-    tokens_display = format_tokens(tokens_in + tokens_out)
-    time_display = format_time(elapsed)
-
-    lines = [
-        "\u2501" * 48,
-        f" Phase {phase}/{total_phases} \u2502 Step {step}/{total_steps} \u2502 {progress_bar} {progress}%",
-        f" Tokens: {tokens_display} \u2502 Cost: ${cost:.2f} \u2502 Model: {model}",
-        f" Mode: {mode} \u2502 Time: {time_display}",
-        "\u2501" * 48
-    ]
+    tokens_display = format_tokens(g("tokens_in", 0) + g("tokens_out", 0))
+    time_display = format_time(g("elapsed_seconds", 0))
 
-    return "\n".join(lines)
+    return (
+        f"{_HUD_RULE}\n"
+        f" Phase {phase}/{total_phases} \u2502 Step {step}/{total_steps} \u2502 {progress_bar} {progress}%\n"
+        f" Tokens: {tokens_display} \u2502 Cost: ${cost:.2f} \u2502 Model: {model}\n"
+        f" Mode: {mode} \u2502 Time: {time_display}\n"
+        f"{_HUD_RULE}"
+    )
 
 
 def render_minimal_hud(metrics: dict) -> str:
     """Render minimal HUD display."""
-    phase = metrics.get("phase", 0)
-    total_phases = metrics.get("total_phases", 0)
-    progress = metrics.get("progress_pct", 0)
-    model = metrics.get("model_tier", "sonnet").capitalize()
+    g = metrics.get
+    tier = g("model_tier", "sonnet")
+    model = _MODEL_CAP.get(tier) or tier.capitalize()
 
-    return f"[{progress}%] Phase {phase}/{total_phases} \u2502 {model}"
+    return f"[{g('progress_pct', 0)}%] Phase {g('phase', 0)}/{g('total_phases', 0)} \u2502 {model}"
 
 
 def main():
@@ -242,6 +324,7 @@ def main():
         output = render_minimal_hud(metrics)
 
     # Output to stderr for display (stdout may be captured)
+    _ensure_utf8_stdio()
     print(output, file=sys.stderr)
 
 
@@ -19,11 +19,13 @@ Usage:
     }]
 """
 
+import atexit
 import json
 import os
+import struct
 import sys
-import tempfile
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -133,9 +135,22 @@ def read_stdin_json() -> Optional[Dict[str, Any]]:
         return None
 
 
-def rotate_if_needed(file_path: Path, max_size: int = 5 * 1024 * 1024, max_backups: int = 5) -> None:
-    """Rotate log file if it exceeds max_size."""
-    if not file_path.exists() or file_path.stat().st_size < max_size:
+# Rotation budget for the observations log
+MAX_LOG_SIZE = 5 * 1024 * 1024
+
+
+def rotate_if_needed(file_path: Path, max_size: int = MAX_LOG_SIZE, max_backups: int = 5,
+                     size: Optional[int] = None) -> None:
+    """Rotate log file if it exceeds max_size.
+
+    Callers that already track the file size can pass it via ``size`` to
+    skip the stat call.
+    """
+    if size is None:
+        if not file_path.exists():
+            return
+        size = file_path.stat().st_size
+    if size < max_size:
         return
 
     # Rotate backups: .5 -> delete, .4 -> .5, .3 -> .4, etc.
@@ -154,85 +169,448 @@ def rotate_if_needed(file_path: Path, max_size: int = 5 * 1024 * 1024, max_backu
     file_path.rename(backup)
 
 
-def append_observation(observation: Dict[str, Any]) -> bool:
-    """Append observation to JSONL file with file locking and rotation."""
+# Fold threads still in flight; joined at exit so a one-shot hook
+# process never exits with a displaced backup stranded under its
+# .old-* name
+_fold_threads: List[threading.Thread] = []
+
+
+def _join_fold_threads() -> None:
+    """Wait for in-flight backup folds before the interpreter exits."""
+    while _fold_threads:
+        _fold_threads.pop().join()
+
+
+atexit.register(_join_fold_threads)
+
+
+def _fold_backup_chain(file_path: Path, displaced: Path, max_backups: int) -> None:
+    """Shift the numbered backups and slot the displaced .1 in as .2.
+
+    Runs on a background thread: the writer only needs the live file
+    renamed before it can continue, not the whole rename chain. The
+    thread is joined at exit via _join_fold_threads.
+    """
+    try:
+        for i in range(max_backups - 1, 1, -1):
+            old_backup = file_path.with_suffix(f'.jsonl.{i}')
+            new_backup = file_path.with_suffix(f'.jsonl.{i + 1}')
+            if old_backup.exists():
+                if new_backup.exists():
+                    new_backup.unlink()
+                old_backup.rename(new_backup)
+        displaced.rename(file_path.with_suffix('.jsonl.2'))
+    except OSError:
+        pass
+
+
+def _rotate_async(file_path: Path, max_backups: int = 5) -> None:
+    """Rotate the log with minimal synchronous work.
+
+    Only the rename of the live file blocks the writer; folding the
+    previous .1 backup into the .2..N chain is handed to a background
+    thread.
+    """
+    # Fold any .old-* file stranded by a crashed process back into the
+    # chain first so rotations never leak backups on disk; the rename
+    # race against a live fold thread resolves with one winner because
+    # _fold_backup_chain swallows OSError
+    for leftover in sorted(file_path.parent.glob(file_path.name + '.1.old-*')):
+        _fold_backup_chain(file_path, leftover, max_backups)
+
+    backup = file_path.with_suffix('.jsonl.1')
+    displaced = None
+    if backup.exists():
+        displaced = file_path.with_suffix(f'.jsonl.1.old-{os.getpid()}-{time.monotonic_ns()}')
+        backup.rename(displaced)
+    file_path.rename(backup)
+    if displaced is not None:
+        t = threading.Thread(
+            target=_fold_backup_chain,
+            args=(file_path, displaced, max_backups),
+            daemon=True
+        )
+        _fold_threads.append(t)
+        t.start()
+
+
+# Fast JSON encoding: orjson when available (C-accelerated, returns
+# bytes), otherwise compact stdlib json without the default whitespace
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Columnar sidecar: fixed-width per-observation metadata written next to
+# the JSONL so counters and filters can scan it without parsing JSON.
+# Record layout: timestamp_ns u64, tool_id u16, success u8, duration_ms u32.
+META_RECORD_FORMAT = '<QHBI'
+META_RECORD_SIZE = struct.calcsize(META_RECORD_FORMAT)
+
+# (ts_ns, tool_name, success, duration_ms) tuples awaiting the next flush
+_pending_meta: List[tuple] = []
+
+# Tool-name → small-int tables, one per observations dir, backed by tools.txt
+_tool_ids: Dict[Path, Dict[str, int]] = {}
+
+
+def _read_tool_table(obs_dir: Path) -> Dict[str, int]:
+    """Read tools.txt into a name -> ID table and cache it for obs_dir."""
+    try:
+        names = (obs_dir / 'tools.txt').read_text(encoding='utf-8').splitlines()
+    except OSError:
+        names = []
+    table = {name: i for i, name in enumerate(names)}
+    _tool_ids[obs_dir] = table
+    return table
+
+
+def _tool_id(obs_dir: Path, tool_name: str) -> int:
+    """Map a tool name to its stable integer ID, appending new names to tools.txt.
+
+    Called under the observations file lock (via _append_meta), so the
+    re-read before assigning a new ID cannot race another process.
+    """
+    table = _tool_ids.get(obs_dir)
+    if table is None:
+        table = _read_tool_table(obs_dir)
+
+    tool_id = table.get(tool_name)
+    if tool_id is None:
+        # Another process may have appended names since our cached read;
+        # re-read under the held lock so the same ID is never handed to
+        # two different tools
+        table = _read_tool_table(obs_dir)
+        tool_id = table.get(tool_name)
+    if tool_id is None:
+        tool_id = len(table)
+        table[tool_name] = tool_id
+        try:
+            with open(obs_dir / 'tools.txt', 'a', encoding='utf-8') as tf:
+                tf.write(tool_name + '\n')
+        except OSError:
+            pass
+    return tool_id
+
+
+def _append_meta(obs_dir: Path, count: int) -> None:
+    """Pack and append the first count queued meta records to meta.bin."""
+    try:
+        packed = b''.join(
+            struct.pack(
+                META_RECORD_FORMAT,
+                ts_ns,
+                _tool_id(obs_dir, tool_name),
+                1 if success else 0,
+                int(duration_ms or 0) & 0xFFFFFFFF,
+            )
+            for ts_ns, tool_name, success, duration_ms in _pending_meta[:count]
+        )
+        with open(obs_dir / 'meta.bin', 'ab') as mf:
+            mf.write(packed)
+    except (OSError, struct.error):
+        pass
+    # Drop the batch either way; the JSONL remains the source of truth
+    del _pending_meta[:count]
+
+
+# Observation batching: serialized lines queue in-process and are drained
+# in one locked write. The default batch size of 1 keeps the one-shot hook
+# process write-through; a persistent runner can raise CAW_OBS_BATCH to
+# amortize the lock and fsync cost across many events.
+try:
+    _BATCH_SIZE = max(1, int(os.environ.get('CAW_OBS_BATCH', '1') or 1))
+except ValueError:
+    # Non-numeric values degrade to write-through rather than killing
+    # every hook at import time
+    _BATCH_SIZE = 1
+_FLUSH_INTERVAL = 0.2  # seconds between forced flushes
+
+# Durability for observation writes: 'none' (default — observations are
+# recoverable telemetry), 'data' (fdatasync, skips the metadata flush),
+# or 'full' (fsync)
+_SYNC_MODE = os.environ.get('CAW_SYNC', 'none').lower()
+
+
+def _sync_fd(fd: int) -> None:
+    """Sync a file descriptor according to the configured CAW_SYNC mode."""
+    if _SYNC_MODE == 'data':
+        # fdatasync is missing on Windows; fall back to fsync there
+        getattr(os, 'fdatasync', os.fsync)(fd)
+    elif _SYNC_MODE == 'full':
+        os.fsync(fd)
+_pending: List[bytes] = []
+_flush_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+# Logical size of the observations file, tracked in-process so the
+# rotation check avoids a stat per flush. Initialized from one stat and
+# advanced by our own writes; concurrent writers can make it lag, which
+# only delays rotation slightly past the soft 5MB budget.
+_obs_size_cache: Optional[tuple] = None  # (path, size_in_bytes)
+
+
+def _tracked_size(obs_file: Path) -> int:
+    """Return the cached logical size of obs_file, stat-ing once per path."""
+    global _obs_size_cache
+    if _obs_size_cache is not None and _obs_size_cache[0] == obs_file:
+        return _obs_size_cache[1]
+    try:
+        size = obs_file.stat().st_size
+    except OSError:
+        size = 0
+    _obs_size_cache = (obs_file, size)
+    return size
+
+
+def _lock_file(f) -> None:
+    """Take the cross-platform exclusive lock on an open file."""
+    if HAS_FCNTL:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    elif HAS_MSVCRT:
+        # Windows locking - lock first byte
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f) -> None:
+    """Release the cross-platform lock on an open file."""
+    if HAS_FCNTL:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    elif HAS_MSVCRT:
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# Observations file handle kept open across flushes in one process, so
+# repeat drains skip the open/close syscall pair
+_obs_out = None  # (path, raw file object)
+
+
+def _obs_handle(obs_file: Path, reopen: bool = False):
+    """Return the persistent append handle for obs_file, (re)opening as needed."""
+    global _obs_out
+    if _obs_out is not None:
+        if _obs_out[0] == obs_file and not reopen:
+            return _obs_out[1]
+        _close_obs_handle()
+    f = open(obs_file, 'ab', buffering=0)
+    _obs_out = (obs_file, f)
+    return f
+
+
+def _close_obs_handle() -> None:
+    """Close the persistent observations handle if open."""
+    global _obs_out
+    if _obs_out is not None:
+        try:
+            _obs_out[1].close()
+        except OSError:
+            pass
+        _obs_out = None
+
+
+def _same_inode(f, path: Path) -> bool:
+    """Check whether an open handle still refers to the file at path."""
     try:
-        obs_file = get_observations_file()
+        return os.fstat(f.fileno()).st_ino == os.stat(path).st_ino
+    except OSError:
+        return False
+
+
+atexit.register(_close_obs_handle)
+
+
+def _drain_staged(pending_dir: Path, f) -> int:
+    """Combine every staged batch file into the main JSONL under the held lock.
+
+    Flat combining: whichever process holds the lock drains all staged
+    files — its own and those of any process that lost the race — so one
+    write and one fsync cover every concurrent writer.
+
+    Returns the number of bytes appended.
+    """
+    # Sweep .tmp staging leftovers from crashed processes. The age floor
+    # keeps us clear of a live writer that has written its .tmp but not
+    # yet renamed it to .jsonl
+    now = time.time()
+    for tmp in pending_dir.glob('*.tmp'):
+        try:
+            if now - tmp.stat().st_mtime > 60:
+                tmp.unlink()
+        except OSError:
+            pass
 
-        # Rotate if needed before appending
-        rotate_if_needed(obs_file)
+    staged_files = sorted(pending_dir.glob('*.jsonl'), key=lambda p: p.stat().st_mtime_ns)
+    chunks = []
+    drained = []
+    for path in staged_files:
+        try:
+            chunks.append(path.read_bytes())
+            drained.append(path)
+        except OSError:
+            continue
+
+    written = 0
+    if chunks:
+        payload = b''.join(chunks)
+        f.write(payload)
+        _sync_fd(f.fileno())
+        written = len(payload)
+
+    for path in drained:
+        try:
+            path.unlink()
+        except OSError:
+            pass
 
-        # Ensure parent directory exists
-        obs_file.parent.mkdir(parents=True, exist_ok=True)
+    return written
 
-        # Direct append with file locking
-        with open(obs_file, 'a', encoding='utf-8') as f:
-            # Lock the file (cross-platform)
-            if HAS_FCNTL:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            elif HAS_MSVCRT:
-                # Windows locking - lock first byte
-                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
 
+def _flush_pending() -> bool:
+    """Drain buffered observations into the JSONL file in one locked write."""
+    global _last_flush, _obs_size_cache
+    with _flush_lock:
+        count = len(_pending)
+        meta_count = len(_pending_meta)
+        if not count:
+            return True
+        try:
+            obs_file = get_observations_file()
+
+            # Stage the batch lock-free: write to a temp name and rename so
+            # the drainer only ever sees complete files
+            pending_dir = obs_file.parent / 'pending'
+            pending_dir.mkdir(parents=True, exist_ok=True)
+            staged = pending_dir / f'{os.getpid()}-{time.monotonic_ns()}.jsonl'
+            staged_tmp = staged.with_suffix('.tmp')
+            staged_tmp.write_bytes(b''.join(_pending[:count]))
+            os.replace(staged_tmp, staged)
+
+            # From here the staged file is the durable copy: drop the
+            # in-memory lines now so a failure below cannot restage the
+            # same batch and duplicate it. Any lock holder — us on the
+            # next flush, or another process — will drain the file.
+            del _pending[:count]
+
+            # Rotate if needed before appending, using the tracked size
+            # so the hot path skips the stat
+            size = _tracked_size(obs_file)
+            if size >= MAX_LOG_SIZE:
+                _close_obs_handle()
+                _rotate_async(obs_file)
+                size = 0
+
+            # Raw unbuffered append through the persistent handle: the
+            # batch is one pre-joined bytes object, so neither the buffer
+            # layer nor a per-flush open/close adds anything
+            f = _obs_handle(obs_file)
+            # The lock is taken blocking, not try-lock: bailing out here
+            # would leave our staged batch waiting for whoever flushes
+            # next, which for a one-shot hook process may be minutes
+            # away. Waits stay short because the current holder drains
+            # every staged file, ours included, before releasing.
+            _lock_file(f)
             try:
-                f.write(json.dumps(observation) + '\n')
-                f.flush()
-                os.fsync(f.fileno())
+                # If another process rotated the log while we held the old
+                # handle, it now points at a backup — reopen and re-lock
+                if not _same_inode(f, obs_file):
+                    _unlock_file(f)
+                    f = _obs_handle(obs_file, reopen=True)
+                    _lock_file(f)
+
+                # If our staged file is gone, a lock holder that beat us
+                # here already drained it on our behalf
+                if staged.exists():
+                    size += _drain_staged(pending_dir, f)
+
+                # Our own meta records append under the same lock hold
+                if meta_count:
+                    _append_meta(obs_file.parent, meta_count)
             finally:
-                # Unlock
-                if HAS_FCNTL:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                elif HAS_MSVCRT:
-                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
-
-        return True
-    except IOError as e:
-        print(f"Failed to write observation: {e}", file=sys.stderr)
-        return False
+                _unlock_file(f)
+
+            _obs_size_cache = (obs_file, size)
+            _last_flush = time.monotonic()
+            return True
+        except IOError as e:
+            print(f"Failed to write observation: {e}", file=sys.stderr)
+            return False
+
+
+def append_observation(observation: Dict[str, Any]) -> bool:
+    """Append observation to JSONL file with file locking and rotation.
+
+    Lines are buffered in-process and flushed once the batch size or the
+    flush interval is exceeded; anything still queued drains at exit.
+    """
+    _pending.append(_dumps(observation) + b'\n')
+    _pending_meta.append((
+        time.time_ns(),
+        observation.get('tool_name', 'unknown'),
+        observation.get('success'),
+        observation.get('duration_ms'),
+    ))
+    if len(_pending) >= _BATCH_SIZE or time.monotonic() - _last_flush >= _FLUSH_INTERVAL:
+        return _flush_pending()
+    return True
+
+
+atexit.register(_flush_pending)
+
+
+# Session ID is constant for the process lifetime; cache it so only the
+# first observation pays the stat + read
+_SESSION_ID: Optional[str] = None
 
 
 def get_session_id() -> str:
     """Get or generate session ID for grouping observations."""
+    global _SESSION_ID
+    if _SESSION_ID is not None:
+        return _SESSION_ID
+
     session_file = get_caw_dir() / 'observations' / '.session_id'
 
     if session_file.exists():
         try:
-            return session_file.read_text(encoding='utf-8').strip()
+            _SESSION_ID = session_file.read_text(encoding='utf-8').strip()
+            return _SESSION_ID
         except IOError:
             pass
 
-    # Generate new session ID with microseconds to reduce collision
+    # Generate new session ID with microseconds to reduce collision.
+    # datetime is only needed on this first-call path, so the import is
+    # deferred out of the hook's cold start.
+    from datetime import datetime, timezone
     session_id = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S-%f')
 
     try:
         session_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Atomic write with tempfile + rename
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=session_file.parent,
-            prefix='.session_id_',
-            suffix='.tmp',
-            text=True
-        )
-
+        # Single O_EXCL create: the session ID is transient and
+        # recoverable, so it needs no fsync or tempfile+rename dance. If a
+        # concurrent hook won the race, adopt its value instead.
         try:
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as temp_f:
-                temp_f.write(session_id)
-                temp_f.flush()
-                os.fsync(temp_f.fileno())
-
-            # Atomic rename
-            os.replace(temp_path, session_file)
-
-        except Exception:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+            fd = os.open(session_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            try:
+                session_id = session_file.read_text(encoding='utf-8').strip() or session_id
+            except IOError:
+                pass
+        else:
+            try:
+                os.write(fd, session_id.encode('utf-8'))
+            finally:
+                os.close(fd)
 
     except IOError:
         pass
 
+    _SESSION_ID = session_id
     return session_id
 
 
@@ -245,8 +623,15 @@ def create_observation(
     duration_ms: Optional[int] = None
 ) -> Dict[str, Any]:
     """Create an observation record."""
+    # time.strftime skips the datetime object construction and the
+    # Python-level isoformat; the fraction is appended separately since
+    # strftime cannot format it. Microsecond precision matters: the
+    # rapid-re-edit detector rejects zero diffs, and whole-second stamps
+    # made back-to-back edits of the same file look simultaneous.
+    secs, frac_ns = divmod(time.time_ns(), 1_000_000_000)
     return {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+                     + f'.{frac_ns // 1000:06d}Z',
         'session_id': get_session_id(),
         'event_type': event_type,  # 'pre' or 'post'
         'tool_name': tool_name,
@@ -266,40 +651,16 @@ def extract_tool_info(hook_input: Dict[str, Any]) -> Dict[str, Any]:
     - PreToolUse: { tool_name, tool_input }
     - PostToolUse: { tool_name, tool_input, tool_output, success, duration_ms }
     """
-    try:
-        tool_name = hook_input.get('tool_name', hook_input.get('toolName', 'unknown'))
-        tool_input = hook_input.get('tool_input', hook_input.get('toolInput'))
-        tool_output = hook_input.get('tool_output', hook_input.get('toolOutput'))
-        success = hook_input.get('success')
-        duration_ms = hook_input.get('duration_ms', hook_input.get('durationMs'))
-
-        return {
-            'tool_name': tool_name,
-            'tool_input': tool_input,
-            'tool_output': tool_output,
-            'success': success,
-            'duration_ms': duration_ms,
-        }
-    except (KeyError, AttributeError) as e:
-        print(f"Failed to extract tool info - {type(e).__name__}: {e}", file=sys.stderr)
-        return {
-            'tool_name': 'unknown',
-            'tool_input': None,
-            'tool_output': None,
-            'success': None,
-            'duration_ms': None,
-        }
-    except Exception as e:
-        import traceback
-        print(f"Unexpected error in extract_tool_info - {type(e).__name__}: {e}", file=sys.stderr)
-        print(traceback.format_exc(), file=sys.stderr)
-        return {
-            'tool_name': 'unknown',
-            'tool_input': None,
-            'tool_output': None,
-            'success': None,
-            'duration_ms': None,
-        }
+    # dict.get never raises, so the snake_case/camelCase fallbacks need no
+    # exception handling; the bound method keeps it to one probe per key
+    g = hook_input.get
+    return {
+        'tool_name': g('tool_name') or g('toolName') or 'unknown',
+        'tool_input': g('tool_input') if 'tool_input' in hook_input else g('toolInput'),
+        'tool_output': g('tool_output') if 'tool_output' in hook_input else g('toolOutput'),
+        'success': g('success'),
+        'duration_ms': g('duration_ms') if 'duration_ms' in hook_input else g('durationMs'),
+    }
 
 
 def should_skip_tool(tool_name: str) -> bool:
@@ -325,8 +686,10 @@ def mask_sensitive_data(data: Any) -> Any:
     if isinstance(data, dict):
         masked = {}
         for key, value in data.items():
-            # Case-insensitive key check
-            if key.lower() in SENSITIVE_KEYS:
+            # Case-insensitive key check; the frozenset holds lowercase
+            # keys, so an exact hit (or an already-lowercase miss) skips
+            # the .lower() allocation
+            if key in SENSITIVE_KEYS or (not key.islower() and key.lower() in SENSITIVE_KEYS):
                 # Only mask if value is not a dict or list (to allow nested processing)
                 if isinstance(value, (dict, list)):
                     masked[key] = mask_sensitive_data(value)
@@ -345,8 +708,9 @@ def truncate_for_storage(data: Any, max_length: int = MAX_STRING_LENGTH) -> Any:
     """
     Truncate large data for storage efficiency and mask sensitive data.
 
-    Combines truncation and sensitive data masking into a single pass.
-    Masking is applied first, then truncation.
+    Combines truncation and sensitive data masking into a single fused
+    recursive pass, so each observation is walked and re-allocated once
+    instead of once per transform.
 
     Args:
         data: Any data structure to process
@@ -355,16 +719,28 @@ def truncate_for_storage(data: Any, max_length: int = MAX_STRING_LENGTH) -> Any:
     Returns:
         Processed data with sensitive values masked and large strings truncated.
     """
-    # First, mask sensitive data
-    data = mask_sensitive_data(data)
-
-    # Then, truncate large strings
+    # Scalar strings truncate and return immediately: masking is keyed on
+    # dict keys, so no masking work ever runs over the discarded tail
     if isinstance(data, str):
         if len(data) > max_length:
             return data[:max_length] + TRUNCATION_SUFFIX
         return data
     elif isinstance(data, dict):
-        return {k: truncate_for_storage(v, max_length) for k, v in data.items()}
+        processed = {}
+        for key, value in data.items():
+            # Containers recurse; leaves are handled inline so each value
+            # costs one isinstance dispatch and truncation bounds the
+            # per-key masking work. Exact (or already-lowercase) keys skip
+            # the .lower() allocation.
+            if isinstance(value, (dict, list)):
+                processed[key] = truncate_for_storage(value, max_length)
+            elif key in SENSITIVE_KEYS or (not key.islower() and key.lower() in SENSITIVE_KEYS):
+                processed[key] = '[MASKED]'
+            elif isinstance(value, str) and len(value) > max_length:
+                processed[key] = value[:max_length] + TRUNCATION_SUFFIX
+            else:
+                processed[key] = value
+        return processed
     elif isinstance(data, list):
         return [truncate_for_storage(item, max_length) for item in data[:MAX_LIST_ITEMS]]
     return data
@@ -372,11 +748,13 @@ def truncate_for_storage(data: Any, max_length: int = MAX_STRING_LENGTH) -> Any:
 
 def observe_pre(hook_input: Dict[str, Any]) -> None:
     """Handle PreToolUse observation."""
-    info = extract_tool_info(hook_input)
-
-    if should_skip_tool(info['tool_name']):
+    # Check the skip list on the raw tool name before doing any work
+    tool_name = hook_input.get('tool_name') or hook_input.get('toolName')
+    if tool_name in SKIP_TOOLS:
         return
 
+    info = extract_tool_info(hook_input)
+
     observation = create_observation(
         event_type='pre',
         tool_name=info['tool_name'],
@@ -388,11 +766,13 @@ def observe_pre(hook_input: Dict[str, Any]) -> None:
 
 def observe_post(hook_input: Dict[str, Any]) -> None:
     """Handle PostToolUse observation."""
-    info = extract_tool_info(hook_input)
-
-    if should_skip_tool(info['tool_name']):
+    # Check the skip list on the raw tool name before doing any work
+    tool_name = hook_input.get('tool_name') or hook_input.get('toolName')
+    if tool_name in SKIP_TOOLS:
         return
 
+    info = extract_tool_info(hook_input)
+
     observation = create_observation(
         event_type='post',
         tool_name=info['tool_name'],
@@ -25,17 +25,37 @@ def cleanup_session():
         except IOError:
             pass
 
+# Observation count that triggers the auto-analyze suggestion
+AUTO_ANALYZE_THRESHOLD = 100
+
+# Block size for newline counting (one read covers typical files)
+_COUNT_CHUNK = 128 * 1024
+
 def check_auto_analyze():
     """Check if auto-analysis should be triggered."""
     obs_file = get_caw_dir() / 'observations' / 'observations.jsonl'
     if not obs_file.exists():
         return False
 
-    # Trigger analysis if observations > 100 lines
+    # Count newlines block-wise in binary and stop as soon as the
+    # threshold is reached — long sessions answer after the first block
+    # instead of pulling the whole file through a line iterator
     try:
-        with open(obs_file, 'r') as f:
-            line_count = sum(1 for _ in f)
-        return line_count >= 100
+        line_count = 0
+        last_byte = b'\n'
+        with open(obs_file, 'rb') as f:
+            while True:
+                chunk = f.read(_COUNT_CHUNK)
+                if not chunk:
+                    break
+                line_count += chunk.count(b'\n')
+                if line_count >= AUTO_ANALYZE_THRESHOLD:
+                    return True
+                last_byte = chunk[-1:]
+        # A file not ending in a newline still has a final partial line
+        if last_byte != b'\n':
+            line_count += 1
+        return line_count >= AUTO_ANALYZE_THRESHOLD
     except IOError:
         return False
 
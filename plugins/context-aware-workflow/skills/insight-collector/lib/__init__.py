@@ -24,6 +24,7 @@ from .evolution import (
     generate_agent_scaffold,
     create_evolution,
     track_evolution,
+    track_evolutions,
     get_evolution_candidates_list,
     EVOLUTION_TYPES,
     MIN_CONFIDENCE,
@@ -63,6 +64,7 @@ __all__ = [
     'generate_agent_scaffold',
     'create_evolution',
     'track_evolution',
+    'track_evolutions',
     'get_evolution_candidates_list',
     # Constants
     'EVOLUTION_TYPES',
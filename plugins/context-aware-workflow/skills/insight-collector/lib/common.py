@@ -1,5 +1,6 @@
 """Common utilities for insight-collector skill."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -10,24 +11,38 @@ SYSTEM_DIRS = frozenset([
     'C:\\Windows', 'C:\\Program Files', 'C:\\Program Files (x86)', 'C:\\System32'
 ])
 
-def get_project_dir() -> Path:
-    """Get project directory from environment or current directory.
+# Separator-suffixed prefixes built once; str.startswith takes the whole
+# tuple in one C-level call
+_SYSTEM_DIR_PREFIXES = tuple(d + os.sep for d in SYSTEM_DIRS)
 
-    Raises:
-        ValueError: If the resolved path is a sensitive system directory.
+
+@functools.lru_cache(maxsize=4)
+def _resolve_project_dir(raw_path: str) -> Path:
+    """Resolve and validate a project directory, cached per raw path.
+
+    Keyed on the unresolved string so a changed CLAUDE_PROJECT_DIR is
+    picked up while repeat calls skip the resolve and validation work.
     """
-    project_dir = Path(os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd())).resolve()
+    project_dir = Path(raw_path).resolve()
 
-    # Path sanitization: refuse system directories
+    # Path sanitization: refuse system directories. Exact matches hit the
+    # frozenset; subdirectory checks go through one tuple-based startswith.
     project_dir_str = str(project_dir)
-    for sys_dir in SYSTEM_DIRS:
-        # Check if project_dir is exactly a system dir or a subdirectory of it
-        if project_dir_str == sys_dir or project_dir_str.startswith(sys_dir + os.sep):
-            raise ValueError(f"Refusing to operate in system directory: {sys_dir}")
+    if project_dir_str in SYSTEM_DIRS or project_dir_str.startswith(_SYSTEM_DIR_PREFIXES):
+        raise ValueError(f"Refusing to operate in system directory: {project_dir_str}")
 
     return project_dir
 
 
+def get_project_dir() -> Path:
+    """Get project directory from environment or current directory.
+
+    Raises:
+        ValueError: If the resolved path is a sensitive system directory.
+    """
+    return _resolve_project_dir(os.environ.get('CLAUDE_PROJECT_DIR') or os.getcwd())
+
+
 def get_caw_dir() -> Path:
     """Get .caw directory path."""
     return get_project_dir() / '.caw'
@@ -6,8 +6,8 @@ Transforms high-confidence instincts into reusable commands, skills, or agents.
 """
 
 import json
+import os
 import re
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -15,6 +15,15 @@ from typing import Any, Dict, Optional
 from .common import get_caw_dir, ensure_dir
 from .types import InstinctSummary
 
+# Fast JSON encoder for evolution log lines: orjson when available
+# (C-accelerated, returns bytes), compact stdlib json otherwise.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -26,6 +35,17 @@ COMMAND_TRIGGERS = ['when user', 'on request', 'user asks for', 'when requesting
 SKILL_TRIGGERS = ['when editing', 'before', 'after', 'during', 'automatically']
 AGENT_TRIGGERS = ['analyze', 'diagnose', 'investigate', 'decide', 'complex', 'reasoning']
 
+# One compiled alternation per category: a single C-level scan replaces
+# the per-keyword Python substring loop in classify_instinct
+_COMMAND_RE = re.compile('|'.join(re.escape(k) for k in COMMAND_TRIGGERS))
+_SKILL_RE = re.compile('|'.join(re.escape(k) for k in SKILL_TRIGGERS))
+_AGENT_RE = re.compile('|'.join(re.escape(k) for k in AGENT_TRIGGERS))
+
+# Exact domain names classify with one O(1) hash lookup; substring checks
+# only run for compound domains like 'workflow/deploy'
+_COMMAND_DOMAINS = frozenset(['workflow'])
+_SKILL_DOMAINS = frozenset(['preference', 'error'])
+
 MIN_CONFIDENCE = 0.6  # Minimum confidence for evolution
 
 
@@ -68,6 +88,13 @@ def ensure_evolved_dirs() -> None:
 # Utility Functions
 # =============================================================================
 
+# Slug patterns compiled once at import; re.sub would otherwise pay a
+# regex-cache lookup per call
+_SLUG_SEP = re.compile(r'[\s_]+')
+_SLUG_STRIP = re.compile(r'[^a-z0-9-]')
+_SLUG_DUP = re.compile(r'-+')
+
+
 def slugify(text: str) -> str:
     """Convert text to kebab-case slug.
 
@@ -81,17 +108,13 @@ def slugify(text: str) -> str:
         >>> slugify("Safe Modify Pattern")
         'safe-modify-pattern'
     """
-    # Convert to lowercase
-    text = text.lower()
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
-    # Remove non-alphanumeric characters except hyphens
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    # Remove duplicate hyphens
-    text = re.sub(r'-+', '-', text)
+    # Lowercase, then: spaces/underscores to hyphens, drop other
+    # non-alphanumerics, collapse duplicate hyphens
+    text = _SLUG_SEP.sub('-', text.lower())
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_DUP.sub('-', text)
     # Strip leading/trailing hyphens
-    text = text.strip('-')
-    return text
+    return text.strip('-')
 
 
 def classify_instinct(instinct: Dict[str, Any]) -> str:
@@ -108,25 +131,25 @@ def classify_instinct(instinct: Dict[str, Any]) -> str:
     domain = instinct.get('domain', '').lower()
 
     # Check for agent indicators (complex reasoning)
-    if any(kw in trigger or kw in action for kw in AGENT_TRIGGERS):
+    if _AGENT_RE.search(trigger) or _AGENT_RE.search(action):
         # Look for decision trees or multi-step reasoning
         if 'if' in action or 'then' in action or '→' in action and action.count('→') >= 3:
             return 'agent'
 
     # Check for command indicators (user-triggered workflows)
-    if any(kw in trigger for kw in COMMAND_TRIGGERS):
+    if _COMMAND_RE.search(trigger):
         # Multi-step workflow
         if '→' in action or 'step' in action:
             return 'command'
 
     # Check for skill indicators (auto-applicable patterns)
-    if any(kw in trigger for kw in SKILL_TRIGGERS):
+    if _SKILL_RE.search(trigger):
         return 'skill'
 
     # Domain-based classification
-    if 'workflow' in domain:
+    if domain in _COMMAND_DOMAINS or 'workflow' in domain:
         return 'command'
-    elif 'preference' in domain or 'error' in domain:
+    elif domain in _SKILL_DOMAINS or 'preference' in domain or 'error' in domain:
         return 'skill'
 
     # Default to skill for simple patterns
@@ -161,38 +184,10 @@ def extract_steps_from_action(action: str) -> list:
 # Scaffold Generation Functions
 # =============================================================================
 
-def generate_command_scaffold(instinct: Dict[str, Any], name: str) -> str:
-    """Generate command markdown from instinct.
-
-    Args:
-        instinct: Instinct dictionary
-        name: Command name (kebab-case)
-
-    Returns:
-        Command markdown content
-    """
-    instinct_id = instinct.get('id', 'unknown')
-    confidence = instinct.get('confidence', 0.0)
-    evidence_count = instinct.get('evidence_count', 0)
-    trigger = instinct.get('trigger', '')
-    action = instinct.get('action', '')
-    domain = instinct.get('domain', '')
-    timestamp = datetime.now(timezone.utc).isoformat()
+# Templates live at module level so each generation call reuses the
+# pre-parsed format plan instead of rebuilding a multi-KB literal.
 
-    # Extract workflow steps
-    steps = extract_steps_from_action(action)
-
-    # Generate step sections
-    step_sections = []
-    for i, step in enumerate(steps, 1):
-        step_sections.append(f"""### Step {i}: {step}
-
-(Details to be customized based on your specific requirements)
-""")
-
-    workflow_section = '\n'.join(step_sections)
-
-    template = f"""---
+_COMMAND_TEMPLATE = """---
 description: Auto-generated from instinct {instinct_id}
 argument-hint: "[args]"
 allowed-tools: Read, Write, Glob, Bash
@@ -239,39 +234,43 @@ allowed-tools: Read, Write, Glob, Bash
 *Edit `.caw/evolved/commands/{name}.md` to customize.*
 """
 
-    return template
 
-
-def generate_skill_scaffold(instinct: Dict[str, Any], name: str) -> str:
-    """Generate SKILL.md from instinct.
+def generate_command_scaffold(instinct: Dict[str, Any], name: str) -> str:
+    """Generate command markdown from instinct.
 
     Args:
         instinct: Instinct dictionary
-        name: Skill name (kebab-case)
+        name: Command name (kebab-case)
 
     Returns:
-        Skill markdown content
+        Command markdown content
     """
-    instinct_id = instinct.get('id', 'unknown')
-    confidence = instinct.get('confidence', 0.0)
-    evidence_count = instinct.get('evidence_count', 0)
-    trigger = instinct.get('trigger', '')
-    action = instinct.get('action', '')
-    timestamp = datetime.now(timezone.utc).isoformat()
+    # Extract workflow steps
+    steps = extract_steps_from_action(instinct.get('action', ''))
 
-    # Extract action steps
-    steps = extract_steps_from_action(action)
+    workflow_section = '\n'.join(
+        f"### Step {i}: {step}\n\n(Details to be customized based on your specific requirements)\n"
+        for i, step in enumerate(steps, 1)
+    )
 
-    # Generate action list
-    action_list = '\n'.join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
+    return _COMMAND_TEMPLATE.format(
+        name=name,
+        instinct_id=instinct.get('id', 'unknown'),
+        confidence=instinct.get('confidence', 0.0),
+        evidence_count=instinct.get('evidence_count', 0),
+        trigger=instinct.get('trigger', ''),
+        workflow_section=workflow_section,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
 
-    template = f"""---
+
+_SKILL_TEMPLATE = """---
 name: {name}
 description: Auto-generated from instinct {instinct_id}
 allowed-tools: Read, Write, Glob
 ---
 
-# {name.replace('-', ' ').title()} - Evolved Skill
+# {title} - Evolved Skill
 
 ## Origin
 
@@ -319,55 +318,35 @@ No user interaction required.
 *Edit `.caw/evolved/skills/{name}/SKILL.md` to customize.*
 """
 
-    return template
-
 
-def generate_agent_scaffold(instinct: Dict[str, Any], name: str) -> str:
-    """Generate agent markdown from instinct.
+def generate_skill_scaffold(instinct: Dict[str, Any], name: str) -> str:
+    """Generate SKILL.md from instinct.
 
     Args:
         instinct: Instinct dictionary
-        name: Agent name (kebab-case)
+        name: Skill name (kebab-case)
 
     Returns:
-        Agent markdown content
+        Skill markdown content
     """
-    instinct_id = instinct.get('id', 'unknown')
-    confidence = instinct.get('confidence', 0.0)
-    evidence_count = instinct.get('evidence_count', 0)
-    trigger = instinct.get('trigger', '')
-    action = instinct.get('action', '')
-    domain = instinct.get('domain', '')
-    timestamp = datetime.now(timezone.utc).isoformat()
-
-    # Extract workflow phases
-    steps = extract_steps_from_action(action)
-
-    # Organize into phases (max 3 phases)
-    phases = []
-    if len(steps) == 1:
-        phases = [("Analysis", steps[0])]
-    elif len(steps) == 2:
-        phases = [("Analysis", steps[0]), ("Execution", steps[1])]
-    else:
-        # Split into 3 phases
-        third = len(steps) // 3
-        phases = [
-            ("Analysis", ' → '.join(steps[:third])),
-            ("Processing", ' → '.join(steps[third:2*third])),
-            ("Delivery", ' → '.join(steps[2*third:]))
-        ]
+    # Extract action steps
+    steps = extract_steps_from_action(instinct.get('action', ''))
 
-    phase_sections = []
-    for phase_name, phase_desc in phases:
-        phase_sections.append(f"""### Phase: {phase_name}
+    action_list = '\n'.join(f"{i}. {step}" for i, step in enumerate(steps, 1))
 
-{phase_desc}
-""")
+    return _SKILL_TEMPLATE.format(
+        name=name,
+        title=name.replace('-', ' ').title(),
+        instinct_id=instinct.get('id', 'unknown'),
+        confidence=instinct.get('confidence', 0.0),
+        evidence_count=instinct.get('evidence_count', 0),
+        trigger=instinct.get('trigger', ''),
+        action_list=action_list,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
 
-    workflow_section = '\n'.join(phase_sections)
 
-    template = f"""---
+_AGENT_TEMPLATE = """---
 name: {name}
 description: Auto-generated from instinct {instinct_id}
 model: sonnet
@@ -385,7 +364,7 @@ whenToUse: |
   </example>
 ---
 
-# {name.replace('-', ' ').title()} - Evolved Agent
+# {title} - Evolved Agent
 
 ## Origin
 
@@ -433,13 +412,128 @@ This agent specializes in {domain} domain, providing structured analysis and exe
 *Edit `.caw/evolved/agents/{name}.md` to customize.*
 """
 
-    return template
+
+def generate_agent_scaffold(instinct: Dict[str, Any], name: str) -> str:
+    """Generate agent markdown from instinct.
+
+    Args:
+        instinct: Instinct dictionary
+        name: Agent name (kebab-case)
+
+    Returns:
+        Agent markdown content
+    """
+    action = instinct.get('action', '')
+
+    # Extract workflow phases
+    steps = extract_steps_from_action(action)
+
+    # Organize into phases (max 3 phases)
+    if len(steps) == 1:
+        phases = [("Analysis", steps[0])]
+    elif len(steps) == 2:
+        phases = [("Analysis", steps[0]), ("Execution", steps[1])]
+    else:
+        # Split into 3 phases
+        third = len(steps) // 3
+        phases = [
+            ("Analysis", ' → '.join(steps[:third])),
+            ("Processing", ' → '.join(steps[third:2*third])),
+            ("Delivery", ' → '.join(steps[2*third:]))
+        ]
+
+    workflow_section = '\n'.join(
+        f"### Phase: {phase_name}\n\n{phase_desc}\n"
+        for phase_name, phase_desc in phases
+    )
+
+    return _AGENT_TEMPLATE.format(
+        name=name,
+        title=name.replace('-', ' ').title(),
+        instinct_id=instinct.get('id', 'unknown'),
+        confidence=instinct.get('confidence', 0.0),
+        evidence_count=instinct.get('evidence_count', 0),
+        trigger=instinct.get('trigger', ''),
+        action=action,
+        domain=instinct.get('domain', ''),
+        workflow_section=workflow_section,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
 
 
 # =============================================================================
 # Evolution Execution
 # =============================================================================
 
+def _evolution_result(
+    success: bool,
+    path: str,
+    evolution_type: str,
+    name: str,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the uniform create_evolution result dict in one place."""
+    return {
+        'success': success,
+        'path': path,
+        'type': evolution_type,
+        'name': name,
+        'error': error,
+    }
+
+
+# O_TMPFILE is Linux-only; other platforms always take the rename path
+_HAS_O_TMPFILE = hasattr(os, 'O_TMPFILE')
+
+
+def _atomic_write(target: Path, payload: bytes, durable: bool = False) -> None:
+    """Write payload to target atomically via a same-directory temp file.
+
+    One open, one write, one rename — none of tempfile's naming and
+    bookkeeping overhead. fsync is opt-in via ``durable``; scaffold and
+    index files are regenerable, so the default skips it.
+
+    On Linux an O_TMPFILE fast path writes an unnamed file in the target
+    directory and publishes it via linkat, skipping the temp-name
+    create/rename pair. Linking cannot replace an existing name, so an
+    existing target (or a lost creation race) falls back to the rename
+    path below.
+    """
+    if _HAS_O_TMPFILE and not target.exists():
+        try:
+            fd = os.open(str(target.parent), os.O_WRONLY | os.O_TMPFILE, 0o644)
+        except OSError:
+            fd = -1  # filesystem without O_TMPFILE support
+        if fd >= 0:
+            try:
+                os.write(fd, payload)
+                if durable:
+                    os.fsync(fd)
+                try:
+                    os.link(f'/proc/self/fd/{fd}', target, follow_symlinks=True)
+                    return
+                except OSError:
+                    pass
+            finally:
+                os.close(fd)
+
+    tmp = target.parent / f'.{target.name}.tmp.{os.getpid()}'
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 def create_evolution(
     instinct: Dict[str, Any],
     evolution_type: str,
@@ -462,24 +556,16 @@ def create_evolution(
     """
     # Validate evolution type
     if evolution_type not in EVOLUTION_TYPES:
-        return {
-            'success': False,
-            'path': '',
-            'type': evolution_type,
-            'name': name,
-            'error': f"Invalid evolution type: {evolution_type}"
-        }
+        return _evolution_result(
+            False, '', evolution_type, name,
+            error=f"Invalid evolution type: {evolution_type}")
 
     # Slugify name
     slug = slugify(name)
     if not slug:
-        return {
-            'success': False,
-            'path': '',
-            'type': evolution_type,
-            'name': name,
-            'error': "Invalid name: could not generate valid slug"
-        }
+        return _evolution_result(
+            False, '', evolution_type, name,
+            error="Invalid name: could not generate valid slug")
 
     # Ensure directories exist
     ensure_evolved_dirs()
@@ -500,52 +586,24 @@ def create_evolution(
             target_dir = get_evolved_dir('agent')
             target_file = target_dir / f"{slug}.md"
     except Exception as e:
-        return {
-            'success': False,
-            'path': '',
-            'type': evolution_type,
-            'name': slug,
-            'error': f"Failed to generate scaffold: {str(e)}"
-        }
+        return _evolution_result(
+            False, '', evolution_type, slug,
+            error=f"Failed to generate scaffold: {str(e)}")
 
     # Check if file already exists
     if target_file.exists():
-        return {
-            'success': False,
-            'path': str(target_file),
-            'type': evolution_type,
-            'name': slug,
-            'error': f"File already exists: {target_file}"
-        }
+        return _evolution_result(
+            False, str(target_file), evolution_type, slug,
+            error=f"File already exists: {target_file}")
 
     # Write file atomically
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=target_file.parent,
-            delete=False,
-            encoding='utf-8'
-        ) as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
-
-        tmp_path.replace(target_file)
-
-        return {
-            'success': True,
-            'path': str(target_file),
-            'type': evolution_type,
-            'name': slug,
-            'error': None
-        }
+        _atomic_write(target_file, content.encode('utf-8'))
+        return _evolution_result(True, str(target_file), evolution_type, slug)
     except Exception as e:
-        return {
-            'success': False,
-            'path': str(target_file),
-            'type': evolution_type,
-            'name': slug,
-            'error': f"Failed to write file: {str(e)}"
-        }
+        return _evolution_result(
+            False, str(target_file), evolution_type, slug,
+            error=f"Failed to write file: {str(e)}")
 
 
 def track_evolution(
@@ -556,7 +614,11 @@ def track_evolution(
     confidence: float,
     evidence_count: int
 ) -> bool:
-    """Add evolution record to instincts/index.json.
+    """Append an evolution record to instincts/evolutions.jsonl.
+
+    The log is append-only: each record costs one O(1) write instead of
+    re-parsing and atomically rewriting the whole instinct index, which
+    grew quadratically with evolution count.
 
     Args:
         instinct_id: Source instinct ID
@@ -569,51 +631,59 @@ def track_evolution(
     Returns:
         True if tracking succeeded, False otherwise
     """
-    index_file = get_caw_dir() / 'instincts' / 'index.json'
-
-    if not index_file.exists():
-        return False
-
-    try:
-        # Read existing index
-        with open(index_file, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return False
-
-    # Ensure evolutions array exists
-    if 'evolutions' not in index:
-        index['evolutions'] = []
-
-    # Add evolution record
-    evolution_record = {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
-        'source_instinct': instinct_id,
-        'confidence': confidence,
-        'evidence_count': evidence_count,
+    return track_evolutions([{
+        'instinct_id': instinct_id,
         'evolution_type': evolution_type,
         'target_path': target_path,
-        'generated_name': generated_name
-    }
+        'generated_name': generated_name,
+        'confidence': confidence,
+        'evidence_count': evidence_count,
+    }]) == 1
 
-    index['evolutions'].append(evolution_record)
-    index['last_updated'] = datetime.now(timezone.utc).isoformat()
 
-    # Write atomically
+def track_evolutions(records: list) -> int:
+    """Append multiple evolution records in one open and one write.
+
+    Batch path for bulk evolution runs: each record dict carries the
+    same fields track_evolution takes, one shared timestamp covers the
+    whole batch, and the joined payload lands in a single append.
+
+    Args:
+        records: List of dicts with instinct_id, evolution_type,
+            target_path, generated_name, confidence, evidence_count
+
+    Returns:
+        Number of records appended (0 on failure)
+    """
+    if not records:
+        return 0
+
+    instincts_dir = get_caw_dir() / 'instincts'
+
+    # Evolutions only make sense against an existing instinct store
+    if not (instincts_dir / 'index.json').exists():
+        return 0
+
+    now_iso = datetime.now(timezone.utc).isoformat()
+    payload = b''.join(
+        _dumps({
+            'timestamp': now_iso,
+            'source_instinct': rec.get('instinct_id'),
+            'confidence': rec.get('confidence'),
+            'evidence_count': rec.get('evidence_count'),
+            'evolution_type': rec.get('evolution_type'),
+            'target_path': rec.get('target_path'),
+            'generated_name': rec.get('generated_name'),
+        }) + b'\n'
+        for rec in records
+    )
+
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            dir=index_file.parent,
-            delete=False,
-            encoding='utf-8'
-        ) as tmp:
-            json.dump(index, tmp, indent=2, ensure_ascii=False)
-            tmp_path = Path(tmp.name)
-
-        tmp_path.replace(index_file)
-        return True
-    except Exception:
-        return False
+        with open(instincts_dir / 'evolutions.jsonl', 'ab') as f:
+            f.write(payload)
+        return len(records)
+    except IOError:
+        return 0
 
 
 # =============================================================================
@@ -5,12 +5,16 @@ Integration API for Insight Collector
 Provides programmatic access to insights and instincts for other CAW skills.
 """
 
+import bisect
+import functools
+import heapq
 import json
 import os
 import re
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from .common import get_project_dir, get_caw_dir
 from .types import (
@@ -20,29 +24,98 @@ from .types import (
     Metrics,
 )
 
+# Fast JSON decoding: orjson when available (C-accelerated), stdlib
+# otherwise. Decode errors from either surface as ValueError.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=4)
+def _data_paths(caw_dir: Path) -> Dict[str, Path]:
+    """Frequently used data paths, derived once per .caw root.
+
+    Keyed on the root so a changed CLAUDE_PROJECT_DIR is honored while
+    repeat API calls skip the Path concatenations.
+    """
+    return {
+        'insights': caw_dir / 'insights',
+        'index': caw_dir / 'instincts' / 'index.json',
+        'observations': caw_dir / 'observations' / 'observations.jsonl',
+    }
+
 
 # =============================================================================
 # Insights API (for context-helper, knowledge-base)
 # =============================================================================
 
+# Insight markdown patterns compiled once at import; looping over the
+# insights directory would otherwise pay a regex-cache lookup per call
+_TITLE_RE = re.compile(r'^# Insight: (.+)$', re.MULTILINE)
+_TAGS_BLOCK_RE = re.compile(r'## Tags\s*\n(.+?)(?:\n##|\Z)', re.DOTALL)
+_TAG_RE = re.compile(r'#(\S+)')
+_CONTENT_RE = re.compile(r'## Content\s*\n(.+?)(?:\n##|\Z)', re.DOTALL)
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Parsed-insight cache keyed by path: {path: (st_mtime_ns, Insight)}.
+# Repeat API calls re-parse only files whose mtime changed; everything
+# else costs a single stat.
+_INSIGHT_CACHE: Dict[str, tuple] = {}
+
+
+def _load_insight(file_path: Union[str, Path]) -> Optional[Insight]:
+    """Parse an insight file through the mtime-keyed cache."""
+    path = str(file_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _INSIGHT_CACHE.pop(path, None)
+        return None
+
+    cached = _INSIGHT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    insight = parse_insight_file(file_path)
+    if insight:
+        _INSIGHT_CACHE[path] = (mtime_ns, insight)
+    else:
+        _INSIGHT_CACHE.pop(path, None)
+    return insight
+
+
 def list_insights(limit: int = 20) -> List[Insight]:
     """List recent insights with metadata."""
-    insights_dir = get_caw_dir() / 'insights'
-    if not insights_dir.exists():
+    insights_dir = _data_paths(get_caw_dir())['insights']
+
+    # os.scandir uses cached dirent data and skips the per-entry Path
+    # construction and re-stat that glob pays
+    try:
+        with os.scandir(insights_dir) as it:
+            paths = [
+                entry.path for entry in it
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)
+            ]
+    except OSError:
         return []
 
     insights = []
-    for file in sorted(insights_dir.glob('*.md'), reverse=True)[:limit]:
-        insight = parse_insight_file(file)
+    # Top-K selection: O(n log k) heap instead of fully sorting the
+    # directory for a small limit
+    for path in heapq.nlargest(limit, paths):
+        insight = _load_insight(path)
         if insight:
             insights.append(insight)
 
     return insights
 
 
-def parse_insight_file(file_path: Path) -> Optional[Insight]:
+def parse_insight_file(file_path: Union[str, Path]) -> Optional[Insight]:
     """Parse an insight markdown file."""
     try:
+        file_path = Path(file_path)
         content = file_path.read_text(encoding='utf-8')
 
         result = {
@@ -51,21 +124,44 @@ def parse_insight_file(file_path: Path) -> Optional[Insight]:
         }
 
         # Extract title
-        title_match = re.search(r'^# Insight: (.+)$', content, re.MULTILINE)
+        title_match = _TITLE_RE.search(content)
         if title_match:
             result['title'] = title_match.group(1).strip()
 
-        # Extract tags
-        tags_match = re.search(r'## Tags\s*\n(.+?)(?:\n##|\Z)', content, re.DOTALL)
+        # Extract tags (list for JSON compat, frozenset for O(1) filtering)
+        tags_match = _TAGS_BLOCK_RE.search(content)
         if tags_match:
-            tags = re.findall(r'#(\S+)', tags_match.group(1))
+            tags = _TAG_RE.findall(tags_match.group(1))
             result['tags'] = tags
+            result['_tag_set'] = frozenset(tags)
 
         # Extract content
-        content_match = re.search(r'## Content\s*\n(.+?)(?:\n##|\Z)', content, re.DOTALL)
+        content_match = _CONTENT_RE.search(content)
         if content_match:
             result['content'] = content_match.group(1).strip()
 
+        # Lowercase once at parse time; searches would otherwise
+        # re-allocate these per query per insight
+        result['_title_lower'] = result.get('title', '').lower()
+        result['_content_lower'] = result.get('content', '').lower()
+        result['_tags_lower_set'] = frozenset(t.lower() for t in result.get('tags', []))
+
+        # Tokenize once here too: relevance scoring works on hashed token
+        # sets, so index rebuilds never re-run the keyword regex on
+        # unchanged files
+        result['_title_tokens'] = frozenset(_KEYWORD_RE.findall(result['_title_lower']))
+        result['_content_tokens'] = frozenset(_KEYWORD_RE.findall(result['_content_lower']))
+
+        # ASCII byte forms for the substring query filter: bytes.find has
+        # a lower setup cost than str containment for short needles.
+        # Non-ASCII insights keep None and search falls back to str.
+        try:
+            result['_title_bytes'] = result['_title_lower'].encode('ascii')
+            result['_content_bytes'] = result['_content_lower'].encode('ascii')
+        except UnicodeEncodeError:
+            result['_title_bytes'] = None
+            result['_content_bytes'] = None
+
         return result
     except IOError:
         return None
@@ -77,19 +173,25 @@ def search_insights(query: str, tags: Optional[List[str]] = None) -> List[Insigh
     results = []
 
     query_lower = query.lower() if query else ''
+    query_bytes = query_lower.encode('ascii') if query_lower.isascii() else None
+    query_tag_set = frozenset(tags) if tags else None
 
     for insight in all_insights:
-        # Tag filter
-        if tags:
-            insight_tags = insight.get('tags', [])
-            if not any(t in insight_tags for t in tags):
+        # Tag filter: hashed intersection instead of a nested membership loop
+        if query_tag_set is not None:
+            if not (query_tag_set & insight.get('_tag_set', frozenset())):
                 continue
 
-        # Query filter
+        # Query filter: bytes.find on the precomputed ASCII forms when
+        # both sides are ASCII, str containment otherwise
         if query_lower:
-            title = insight.get('title', '').lower()
-            content = insight.get('content', '').lower()
-            if query_lower not in title and query_lower not in content:
+            title_bytes = insight.get('_title_bytes')
+            if query_bytes is not None and title_bytes is not None:
+                if (title_bytes.find(query_bytes) == -1
+                        and insight['_content_bytes'].find(query_bytes) == -1):
+                    continue
+            elif (query_lower not in insight.get('_title_lower', '')
+                    and query_lower not in insight.get('_content_lower', '')):
                 continue
 
         results.append(insight)
@@ -97,57 +199,124 @@ def search_insights(query: str, tags: Optional[List[str]] = None) -> List[Insigh
     return results
 
 
+# Relevance scoring weights per field
+_TITLE_WEIGHT = 3
+_TAG_WEIGHT = 2
+_CONTENT_WEIGHT = 1
+
+# Inverted keyword index: {keyword: [(insight_idx, weight), ...]}, cached
+# with a generation tuple of (path, mtime_ns) pairs so it rebuilds only
+# when the underlying insight set changes
+_INDEX_CACHE: Optional[tuple] = None
+
+
+def _relevance_index(insights: List[Insight]) -> Dict[str, list]:
+    """Build (or reuse) the inverted keyword index over insights."""
+    global _INDEX_CACHE
+    generation = tuple(
+        (i.get('file', ''), _INSIGHT_CACHE.get(i.get('file', ''), (0, None))[0])
+        for i in insights
+    )
+    if _INDEX_CACHE is not None and _INDEX_CACHE[0] == generation:
+        return _INDEX_CACHE[1]
+
+    index: Dict[str, list] = {}
+    for idx, insight in enumerate(insights):
+        fields = (
+            (insight.get('_title_tokens', ()), _TITLE_WEIGHT),
+            (insight.get('_content_tokens', ()), _CONTENT_WEIGHT),
+            (insight.get('_tags_lower_set', ()), _TAG_WEIGHT),
+        )
+        for tokens, weight in fields:
+            for token in tokens:
+                index.setdefault(token, []).append((idx, weight))
+
+    _INDEX_CACHE = (generation, index)
+    return index
+
+
 def get_relevant_insights(context: str, limit: int = 5) -> List[Insight]:
     """Get insights relevant to the given context (for context-helper)."""
     # Simple keyword extraction
-    keywords = re.findall(r'\b[a-zA-Z]{4,}\b', context.lower())
-    keyword_set = set(keywords)
+    keyword_set = set(_KEYWORD_RE.findall(context.lower()))
 
     all_insights = list_insights(limit=50)
-    scored = []
-
-    for insight in all_insights:
-        title = insight.get('title', '').lower()
-        content = insight.get('content', '').lower()
-        tags = insight.get('tags', [])
-
-        score = 0
-        for kw in keyword_set:
-            if kw in title:
-                score += 3
-            if kw in content:
-                score += 1
-            if kw in tags:
-                score += 2
+    index = _relevance_index(all_insights)
 
-        if score > 0:
-            scored.append((score, insight))
+    # Score via index lookups: O(keywords + hits) instead of a substring
+    # scan over every insight per keyword
+    scores: Counter = Counter()
+    for kw in keyword_set:
+        for idx, weight in index.get(kw, ()):
+            scores[idx] += weight
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [s[1] for s in scored[:limit]]
+    # Top-K by score without fully sorting the scored list
+    top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    return [all_insights[idx] for idx, _ in top]
 
 
 # =============================================================================
 # Instincts API (for pattern-learner, evolve command)
 # =============================================================================
 
-def list_instincts(min_confidence: float = 0.0) -> List[InstinctSummary]:
-    """List instincts with optional confidence filter."""
-    index_file = get_caw_dir() / 'instincts' / 'index.json'
-    if not index_file.exists():
-        return []
+# Parsed instinct index cached per process together with a
+# confidence-descending view and its bisect keys, all keyed on
+# (path, st_mtime_ns); everything re-derives only when the file changes
+_INDEX_FILE_CACHE: Optional[tuple] = None
+
 
+def _index_state() -> tuple:
+    """Return (index, sorted_instincts, neg_confidences) through the cache."""
+    global _INDEX_FILE_CACHE
+    index_file = _data_paths(get_caw_dir())['index']
+    path = str(index_file)
     try:
-        with open(index_file, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return ({}, [], [])
+
+    cached = _INDEX_FILE_CACHE
+    if cached is not None and cached[0] == path and cached[1] == mtime_ns:
+        return cached[2:]
 
-    instincts = index.get('instincts', [])
+    try:
+        with open(index_file, 'rb') as f:
+            index = _loads(f.read())
+    except (ValueError, IOError):
+        return ({}, [], [])
+
+    ordered = sorted(
+        index.get('instincts', []),
+        key=lambda x: x.get('confidence', 0),
+        reverse=True
+    )
+    # Negated keys ascend, which is what bisect needs for the cutoff
+    neg_confidences = [-i.get('confidence', 0) for i in ordered]
+
+    _INDEX_FILE_CACHE = (path, mtime_ns, index, ordered, neg_confidences)
+    return (index, ordered, neg_confidences)
+
+
+def _read_index() -> dict:
+    """Read instincts/index.json through the mtime-keyed cache."""
+    return _index_state()[0]
+
+
+def list_instincts(min_confidence: float = 0.0) -> List[InstinctSummary]:
+    """List instincts with optional confidence filter."""
+    _, ordered, neg_confidences = _index_state()
     if min_confidence > 0:
-        instincts = [i for i in instincts if i.get('confidence', 0) >= min_confidence]
+        # The cached view descends monotonically, so the filter is one
+        # O(log n) bisect instead of a scan plus a fresh sort
+        cutoff = bisect.bisect_right(neg_confidences, -min_confidence)
+        return ordered[:cutoff]
+    return list(ordered)
 
-    return sorted(instincts, key=lambda x: x.get('confidence', 0), reverse=True)
+
+# Exact domain names classify with one O(1) hash lookup; the substring
+# checks only run for compound domains like 'workflow/deploy'
+_COMMAND_DOMAINS = frozenset(['workflow'])
+_SKILL_DOMAINS = frozenset(['preference', 'error'])
 
 
 def get_evolution_candidates() -> EvolutionCandidates:
@@ -162,11 +331,11 @@ def get_evolution_candidates() -> EvolutionCandidates:
 
     for inst in candidates:
         domain = inst.get('domain', '')
-        trigger = inst.get('trigger', '')
 
-        if 'workflow' in domain or '→' in trigger:
+        # Frozenset hits short-circuit; the trigger scan for '→' runs last
+        if domain in _COMMAND_DOMAINS or 'workflow' in domain or '→' in inst.get('trigger', ''):
             result['commands'].append(inst)
-        elif 'preference' in domain or 'error' in domain:
+        elif domain in _SKILL_DOMAINS or 'preference' in domain or 'error' in domain:
             result['skills'].append(inst)
         else:
             result['agents'].append(inst)
@@ -180,27 +349,43 @@ def get_evolution_candidates() -> EvolutionCandidates:
 
 def get_insight_count() -> int:
     """Get total count of insights."""
-    insights_dir = get_caw_dir() / 'insights'
-    if not insights_dir.exists():
+    insights_dir = _data_paths(get_caw_dir())['insights']
+    # Counting needs neither parsing nor Path objects per entry
+    try:
+        with os.scandir(insights_dir) as it:
+            return sum(
+                1 for entry in it
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)
+            )
+    except OSError:
         return 0
-    return len(list(insights_dir.glob('*.md')))
 
 
 def get_instinct_count() -> int:
     """Get total count of instincts."""
-    instincts = list_instincts()
-    return len(instincts)
+    # Length only — skip list_instincts' filtering and sort
+    return len(_read_index().get('instincts', []))
 
 
 def get_observation_count() -> int:
     """Get total count of observations."""
-    obs_file = get_caw_dir() / 'observations' / 'observations.jsonl'
+    obs_file = _data_paths(get_caw_dir())['observations']
     if not obs_file.exists():
         return 0
 
+    # Count newlines block-wise in binary: bytes.count is a C-level scan
+    # and skips the UTF-8 decode that line iteration would pay
     try:
-        with open(obs_file, 'r') as f:
-            return sum(1 for _ in f)
+        count = 0
+        last_byte = b'\n'
+        with open(obs_file, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                count += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+        # A file not ending in a newline still has a final partial line
+        if last_byte != b'\n':
+            count += 1
+        return count
     except IOError:
         return 0
 
